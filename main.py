@@ -5,7 +5,9 @@ import sys
 
 def main() -> None:
     """Launch the WatchDogs OSINT Flask server."""
-    from src.backend.app import run_server
+    # server.py does not import the Flask app: gunicorn loads it inside the
+    # (already gevent-patched) worker, so ssl/urllib3 are imported after patching.
+    from src.backend.server import run_server
 
     run_server()
 
@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+# =============================================================================
+# WatchDogs Security City — production server
+# Runs main.py, which serves the app with gunicorn + one gevent worker
+# (settings in src/backend/config.py and src/backend/server.py). The
+# Dockerfile and render.yaml use the same entry point.
+# =============================================================================
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+exec python main.py
@@ -28,6 +28,7 @@ from ...config import (
     OPENAI_MODEL,
     OPENAI_TEMPERATURE,
 )
+from ..http_client import llm_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,7 @@ class ChatGraphBuilder:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             temperature=OPENAI_TEMPERATURE,
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
         )
@@ -1,5 +1,6 @@
 """Multi-frame orchestration with sequential and Send-based parallel modes."""
 
+import hashlib
 import logging
 import operator
 from collections.abc import Callable
@@ -21,6 +22,8 @@ class FrameWorkerState(TypedDict):
     context: str
     frame_index: int
     description: str
+    # (frame_index, description) of later frames with identical content
+    duplicates: NotRequired[list[tuple[int, str]]]
 
 
 class MultiFrameGraphState(TypedDict):
@@ -32,6 +35,17 @@ class MultiFrameGraphState(TypedDict):
     summary: NotRequired[str]
 
 
+def _frame_digest(frame_base64: str) -> bytes:
+    """SHA-256 of a frame payload, used to analyze byte-identical frames once."""
+    return hashlib.sha256(frame_base64.encode("utf-8")).digest()
+
+
+def _log_duplicates(duplicates: int, total: int) -> None:
+    """Log how many analyzer calls frame deduplication saved."""
+    if duplicates:
+        logger.info("Dedup saved %s/%s frame analyses (identical frames)", duplicates, total)
+
+
 class MultiFrameHandler:
     """Handle multi-frame analysis with optional context accumulation."""
 
@@ -50,15 +64,24 @@ class MultiFrameHandler:
         def analyze_frame_worker(state: FrameWorkerState) -> dict[str, list[dict[str, Any]]]:
             """Analyze one frame in an isolated Send worker."""
             result = analyzer(state["frame_base64"], state["context"])
-            return {
-                "individual_results": [
-                    {
-                        "frame_index": state["frame_index"] + 1,
-                        "description": state["description"],
-                        "result": result,
-                    }
-                ]
-            }
+            first_index = state["frame_index"] + 1
+            entries = [
+                {
+                    "frame_index": first_index,
+                    "description": state["description"],
+                    "result": result,
+                }
+            ]
+            entries.extend(
+                {
+                    "frame_index": idx + 1,
+                    "description": description,
+                    "result": result,
+                    "duplicate_of": first_index,
+                }
+                for idx, description in state.get("duplicates", [])
+            )
+            return {"individual_results": entries}
 
         def synthesize_results(
             state: MultiFrameGraphState,
@@ -76,20 +99,26 @@ class MultiFrameHandler:
             }
 
         def dispatch_frames(state: MultiFrameGraphState) -> list[Send]:
-            """Generate one Send instruction per independent frame."""
+            """Generate one Send instruction per distinct frame (duplicates ride along)."""
             frames = state["frames"]
-            return [
-                Send(
-                    "analyze_frame_worker",
+            workers: dict[bytes, FrameWorkerState] = {}
+            for idx, frame_data in enumerate(frames):
+                description = frame_data.get("description", f"Frame {idx + 1}")
+                frame_base64 = frame_data.get("frame", "")
+                worker = workers.setdefault(
+                    _frame_digest(frame_base64),
                     {
-                        "frame_base64": frame_data.get("frame", ""),
-                        "context": frame_data.get("description", f"Frame {idx + 1}"),
+                        "frame_base64": frame_base64,
+                        "context": description,
                         "frame_index": idx,
-                        "description": frame_data.get("description", f"Frame {idx + 1}"),
+                        "description": description,
+                        "duplicates": [],
                     },
                 )
-                for idx, frame_data in enumerate(frames)
-            ]
+                if worker["frame_index"] != idx:
+                    worker["duplicates"].append((idx, description))
+            _log_duplicates(len(frames) - len(workers), len(frames))
+            return [Send("analyze_frame_worker", worker) for worker in workers.values()]
 
         workflow = StateGraph(MultiFrameGraphState)
         workflow.add_node("analyze_frame_worker", analyze_frame_worker)
@@ -133,10 +162,28 @@ class MultiFrameHandler:
         accumulated_ocr_texts: list[str] = []
         accumulated_detections: list[str] = []
 
+        # digest -> (frame_index, result) of the first frame with that content
+        analyzed: dict[bytes, tuple[int, dict[str, Any]]] = {}
+
         try:
             for idx, frame_data in enumerate(frames):
                 frame_base64 = frame_data.get("frame", "")
                 description = frame_data.get("description", f"Frame {idx + 1}")
+
+                digest = _frame_digest(frame_base64)
+                if digest in analyzed:
+                    # Identical frame: its clues are already accumulated
+                    first_index, result = analyzed[digest]
+                    individual_results.append(
+                        {
+                            "frame_index": idx + 1,
+                            "description": description,
+                            "result": result,
+                            "duplicate_of": first_index,
+                        }
+                    )
+                    continue
+
                 context = self._build_frame_context(
                     idx=idx,
                     total_frames=len(frames),
@@ -148,6 +195,7 @@ class MultiFrameHandler:
                 )
                 logger.info("Analyzing frame %s/%s: %s", idx + 1, len(frames), description)
                 result = self.single_frame_analyzer(frame_base64, context)
+                analyzed[digest] = (idx + 1, result)
                 self._extract_clues_from_result(
                     result=result,
                     idx=idx,
@@ -162,6 +210,7 @@ class MultiFrameHandler:
                         "result": result,
                     }
                 )
+            _log_duplicates(len(frames) - len(analyzed), len(frames))
             combined_geolocation = self._combine_geolocation_results(individual_results)
             summary = self._generate_multi_frame_summary(individual_results, combined_geolocation)
             logger.info("Sequential multi-frame analysis complete (%s frames)", len(frames))
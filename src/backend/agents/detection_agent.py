@@ -34,6 +34,7 @@ from ..exceptions import (
     OpenAITimeoutError,
     PydanticValidationError,
 )
+from .http_client import llm_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ class DetectionAgent:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             temperature=OPENAI_TEMPERATURE,
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
         )
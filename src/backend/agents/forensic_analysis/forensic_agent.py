@@ -41,6 +41,7 @@ from ...utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 from ...utils.metrics_utils import _noop_decorator, track_agent_metrics
 from ...utils.retry_utils import agent_retry
 from ...utils.timeout_utils import with_timeout
+from ..http_client import llm_http_client
 from .prompts import FORENSIC_ANALYSIS_PROMPT
 from .response_parser import ForensicResponseParser
 
@@ -66,6 +67,7 @@ class ForensicAnalysisAgent:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             temperature=0.1,  # Very low temperature for objective forensic analysis
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
         )
@@ -44,6 +44,7 @@ from ..utils.retry_utils import agent_retry
 from ..utils.timeout_utils import with_timeout
 from .geolocation.prompts import GEOLOCATION_PROMPT
 from .geolocation.response_parser import GeolocationResponseParser
+from .http_client import llm_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,7 @@ class GeolocationAgent:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             temperature=0.2,  # Low temperature for precise location identification
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
         )
@@ -0,0 +1,46 @@
+"""
+Shared HTTP client for all LLM calls.
+
+Every agent's ``ChatOpenAI`` is handed the same ``httpx.Client`` so calls
+reuse pooled keep-alive connections instead of opening a new TCP + TLS
+session per request. When the optional ``h2`` package is installed the
+client speaks HTTP/2, multiplexing the concurrent per-agent and
+multi-frame calls over a single connection.
+"""
+
+import logging
+
+import httpx
+from openai import DefaultHttpxClient
+
+from ..config import (
+    OPENAI_HTTP_KEEPALIVE_EXPIRY,
+    OPENAI_HTTP_MAX_CONNECTIONS,
+    OPENAI_HTTP_MAX_KEEPALIVE,
+)
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+llm_http_client = DefaultHttpxClient(
+    limits=httpx.Limits(
+        max_connections=OPENAI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=OPENAI_HTTP_KEEPALIVE_EXPIRY,
+    ),
+    http2=H2_AVAILABLE,
+)
+
+logger.info(
+    "🔌 LLM HTTP pool: %d connections, %d keep-alive (%.0fs), HTTP/%s",
+    OPENAI_HTTP_MAX_CONNECTIONS,
+    OPENAI_HTTP_MAX_KEEPALIVE,
+    OPENAI_HTTP_KEEPALIVE_EXPIRY,
+    "2" if H2_AVAILABLE else "1.1",
+)
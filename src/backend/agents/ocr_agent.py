@@ -33,6 +33,7 @@ from ..exceptions import (
     OpenAITimeoutError,
     PydanticValidationError,
 )
+from .http_client import llm_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ class OCRAgent:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
             temperature=0.1,  # Lower temperature for OCR accuracy
         )
@@ -16,6 +16,8 @@ from ..config import (
     CACHE_ENABLED,
     CACHE_TTL_SECONDS,
     CIRCUIT_BREAKER_ENABLED,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
     METRICS_ENABLED,
     OPENAI_API_KEY,
     OPENAI_BASE_URL,
@@ -34,6 +36,7 @@ from ..exceptions import (
     OpenAITimeoutError,
     PydanticValidationError,
 )
+from .http_client import llm_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,17 +49,13 @@ class VisionAgent:
         self.llm = ChatOpenAI(
             model=OPENAI_MODEL,
             api_key=OPENAI_API_KEY,
+            http_client=llm_http_client,
             temperature=OPENAI_TEMPERATURE,
             **({"base_url": OPENAI_BASE_URL} if OPENAI_BASE_URL else {}),
         )
 
         # Initialize circuit breaker ONCE per agent instance (shared state)
         if CIRCUIT_BREAKER_ENABLED:
-            from ..config import (
-                CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-                CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-            )
-
             self.breaker = CircuitBreaker(
                 failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
                 recovery_timeout=CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
@@ -2,21 +2,33 @@
 Analysis routes: frame analysis, chat, batch processing
 """
 
+import hashlib
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 from flask import Blueprint, Response, jsonify, request
+from pydantic import ValidationError
 
 from ..agents.coordinator import CoordinatorAgent
 from ..agents.vision_agent import VisionAgent
-from ..config import MAX_BASE64_SIZE_BYTES, MAX_BASE64_SIZE_MB
+from ..config import (
+    CACHE_ENABLED,
+    CACHE_TTL_SECONDS,
+    CHAT_PARALLEL_WORKERS,
+    MAX_BASE64_SIZE_BYTES,
+    MAX_BASE64_SIZE_MB,
+)
 from ..exceptions import ImageProcessingError
+from ..models.requests import MAX_BATCH_FRAMES, AnalyzeBatchRequest, AnalyzeFrameRequest
 from ..services.image_service import ImageService
 from ..services.session_store import session_store
+from ..utils.cache_utils import get_cached_result, set_cached_result
 from ..utils.location_extractor import LocationExtractor
 from .middleware import auth_required
+from .rate_limit import ANALYSIS_RATE_LIMIT, limiter
 
 logger = logging.getLogger(__name__)
 
@@ -33,31 +45,97 @@ location_extractor = LocationExtractor()
 _chat_vision_agent = VisionAgent()
 
 
-def validate_base64_size(base64_string: str) -> tuple[bool, str | None]:
+# Largest request body each endpoint can legitimately receive: its frame
+# budget as base64 (4 chars per 3 bytes) plus room for context/ROI fields.
+_REQUEST_OVERHEAD_BYTES = 256 * 1024
+_MAX_FRAMES_PER_REQUEST = {
+    "analysis.analyze_batch": MAX_BATCH_FRAMES,
+    "analysis.chat_query": MAX_BATCH_FRAMES,
+}
+
+
+@analysis_bp.before_request
+def reject_oversized_body():
+    """
+    Reject bodies that cannot fit the endpoint's frame budget before parsing.
+
+    Runs on Content-Length alone, so an oversize upload is refused without
+    reading it or materializing its frames as Python strings.
     """
-    Validate base64 string size to prevent DoS attacks.
+    if request.content_length is None:
+        return None
+
+    max_frames = _MAX_FRAMES_PER_REQUEST.get(request.endpoint, 1)
+    max_body = max_frames * (MAX_BASE64_SIZE_BYTES * 4 // 3) + _REQUEST_OVERHEAD_BYTES
+    if request.content_length > max_body:
+        logger.warning(
+            "⚠️ Rejected %s body for %s before parsing", request.content_length, request.endpoint
+        )
+        return jsonify(
+            {
+                "success": False,
+                "error": f"Request too large. Max {MAX_BASE64_SIZE_MB}MB per frame, "
+                f"{max_frames} frame(s) per request",
+            }
+        ), 413
+    return None
+
 
-    H-8: Base64 encodes 3 bytes into 4 chars, so the decoded byte size is
-    approximately ``len(string) * 3 / 4``.  We compare *decoded* bytes
-    against MAX_BASE64_SIZE_BYTES to avoid the ~33 % under-counting bug
-    of comparing character length directly.
+def frame_analysis_cache_key(prepared_base64: str, context: str) -> str:
+    """
+    Cache key for a full analyze-frame report.
+
+    Hashes the exact payload sent to the agents (so a different ROI is a
+    different key) plus the context, feeding both to one SHA-256 without
+    concatenating multi-MB strings.
+    """
+    digest = hashlib.sha256(prepared_base64.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(context.encode("utf-8"))
+    return f"frame_analysis:{digest.hexdigest()}"
+
+
+def validation_error_response(exc: ValidationError, missing_error: str) -> tuple[Response, int]:
+    """
+    Map a request-model ValidationError to the API's JSON error responses.
+
+    Oversize frames keep their 413 (DoS prevention); every other problem is
+    a 400, with the first error reported.
 
     Args:
-        base64_string: Base64 encoded string
+        exc: Error raised by ``model_validate_json``
+        missing_error: Message used when the top-level frame field is absent
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Flask response tuple (jsonify, status_code)
     """
-    # Strip optional data-URI prefix for accurate measurement
-    raw = base64_string.split(",", 1)[-1] if "," in base64_string else base64_string
-    estimated_bytes = len(raw) * 3 // 4
-    if estimated_bytes > MAX_BASE64_SIZE_BYTES:
-        size_mb = estimated_bytes / (1024 * 1024)
-        return (
-            False,
-            f"Frame too large ({size_mb:.1f}MB). Max allowed: {MAX_BASE64_SIZE_MB}MB",
-        )
-    return True, None
+    # include_input=False: never echo (or hold on to) multi-MB frame strings
+    errors = exc.errors(include_url=False, include_input=False)
+
+    for err in errors:
+        loc = err["loc"]
+        if loc == ("frames",) and err["type"] in ("too_short", "too_long"):
+            error = f"Provide between 1 and {MAX_BATCH_FRAMES} frames"
+            return jsonify({"success": False, "error": error}), 400
+
+    for err in errors:
+        if err["type"] == "frame_too_large":
+            prefix = f"Frame {err['loc'][1] + 1}: " if err["loc"][0] == "frames" else ""
+            logger.warning("⚠️ Base64 validation failed: %s", err["msg"])
+            return jsonify({"success": False, "error": prefix + err["msg"]}), 413
+
+    err = errors[0]
+    loc = err["loc"]
+    if err["type"] == "missing" and len(loc) == 1:
+        error = missing_error
+    elif err["type"] == "missing" and loc[0] == "frames" and loc[-1] == "frame":
+        error = f"Frame {loc[1] + 1} missing base64 data"
+    elif err["type"] in ("json_invalid", "model_type"):
+        error = "Request body must be a JSON object"
+    else:
+        field = ".".join(str(part) for part in loc)
+        error = f"Invalid '{field}': {err['msg']}"
+    return jsonify({"success": False, "error": error}), 400
 
 
 def detect_specific_frame_request(message: str, total_frames: int) -> int | None:
@@ -127,7 +205,8 @@ def detect_specific_frame_request(message: str, total_frames: int) -> int | None
     return None
 
 
-@analysis_bp.route("/analyze-frame", methods=["POST"])
+@analysis_bp.post("/analyze-frame")
+@limiter.limit(ANALYSIS_RATE_LIMIT)
 @auth_required
 def analyze_frame():
     """
@@ -143,36 +222,33 @@ def analyze_frame():
     Returns: JSON with analysis results (both structured JSON and readable text)
     """
     try:
-        data = request.get_json()
-
-        if not data or "frame" not in data:
-            return jsonify({"success": False, "error": "No frame data provided"}), 400
-
-        frame_base64 = data["frame"]
-        roi_coords = data.get("roi")
-        context = data.get("context", "")
-
-        # Validate base64 size (DoS prevention)
-        is_valid, error_msg = validate_base64_size(frame_base64)
-        if not is_valid:
-            logger.warning("⚠️ Base64 validation failed: %s", error_msg)
-            return jsonify({"success": False, "error": error_msg}), 413  # Payload Too Large
-
-        # Log ROI info (DEBUG level to avoid noise in production)
-        logger.debug("=" * 80)
-        logger.debug("ROI COORDS RECEIVED: %s", roi_coords)
-        logger.debug("ROI TYPE: %s", type(roi_coords))
-        if roi_coords:
-            logger.debug(
-                "ROI x=%s, y=%s, w=%s, h=%s",
-                roi_coords.get("x"),
-                roi_coords.get("y"),
-                roi_coords.get("width"),
-                roi_coords.get("height"),
-            )
-        else:
-            logger.debug("NO ROI - Analyzing FULL frame")
-        logger.debug("=" * 80)
+        # Parse + validate (shape and base64 size) in pydantic-core; cache=False
+        # so the multi-MB raw body is not kept alive on the request
+        try:
+            body = AnalyzeFrameRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return validation_error_response(e, "No frame data provided")
+
+        frame_base64 = body.frame
+        roi_coords = body.roi_coords()
+        context = body.context
+
+        # Log ROI info (DEBUG level; guarded so the argument lookups are skipped in production)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=" * 80)
+            logger.debug("ROI COORDS RECEIVED: %s", roi_coords)
+            logger.debug("ROI TYPE: %s", type(roi_coords))
+            if roi_coords:
+                logger.debug(
+                    "ROI x=%s, y=%s, w=%s, h=%s",
+                    roi_coords.get("x"),
+                    roi_coords.get("y"),
+                    roi_coords.get("width"),
+                    roi_coords.get("height"),
+                )
+            else:
+                logger.debug("NO ROI - Analyzing FULL frame")
+            logger.debug("=" * 80)
 
         if context:
             logger.info("ℹ️ Context provided: %s chars", len(context))
@@ -193,19 +269,30 @@ def analyze_frame():
             context = f"{roi_ctx}\n{context}" if context else roi_ctx
 
         # Create session and store image for subsequent chat messages
-        session_id = data.get("session_id") or session_store.create_session()
+        session_id = body.session_id or session_store.create_session()
         thread_id = session_store.get_thread_id(session_id)
         image_id = session_store.store_image(session_id, prepared_base64, "analysis frame")
 
-        # Execute multi-agent analysis with session thread_id
-        results = coordinator.analyze_frame(prepared_base64, context, thread_id=thread_id)
+        # Resubmitting the same frame/ROI with the same context (retry, refresh)
+        # reuses the previous report instead of re-running all agents
+        cache_key = frame_analysis_cache_key(prepared_base64, context) if CACHE_ENABLED else None
+        results = get_cached_result(cache_key, CACHE_TTL_SECONDS) if cache_key else None
 
-        # Store analysis results in session for chat reference
-        session_store.store_analysis_result(session_id, results)
+        if results is None:
+            # Execute multi-agent analysis with session thread_id
+            results = coordinator.analyze_frame(prepared_base64, context, thread_id=thread_id)
+            if cache_key and results.get("json", {}).get("status") == "success":
+                set_cached_result(cache_key, results, CACHE_TTL_SECONDS)
 
-        # Add timestamp
+        # Add timestamp (on a copy — the cached report's dicts are shared)
         if "json" in results:
-            results["json"]["timestamp"] = datetime.now(UTC).isoformat()
+            results = {
+                **results,
+                "json": {**results["json"], "timestamp": datetime.now(UTC).isoformat()},
+            }
+
+        # Store analysis results in session for chat reference
+        session_store.store_analysis_result(session_id, results)
 
         logger.info("Frame analysis complete (session=%s)", session_id[:8])
 
@@ -234,7 +321,8 @@ def analyze_frame():
         return jsonify({"success": False, "error": "Internal analysis error"}), 500
 
 
-@analysis_bp.route("/analyze-frame-stream", methods=["POST"])
+@analysis_bp.post("/analyze-frame-stream")
+@limiter.limit(ANALYSIS_RATE_LIMIT)
 @auth_required
 def analyze_frame_stream():
     """
@@ -246,25 +334,22 @@ def analyze_frame_stream():
     - event: error         — if analysis fails
     """
     try:
-        data = request.get_json()
-
-        if not data or "frame" not in data:
-            return jsonify({"success": False, "error": "No frame data provided"}), 400
-
-        frame_base64 = data["frame"]
-        roi_coords = data.get("roi")
-        context = data.get("context", "")
+        try:
+            body = AnalyzeFrameRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return validation_error_response(e, "No frame data provided")
 
-        is_valid, error_msg = validate_base64_size(frame_base64)
-        if not is_valid:
-            return jsonify({"success": False, "error": error_msg}), 413
+        frame_base64 = body.frame
+        roi_coords = body.roi_coords()
+        context = body.context
 
         _image, prepared_base64, crop_meta = image_service.prepare_for_analysis(
             frame_base64, roi_coords
         )
 
         # Log ROI info for debugging (matching non-SSE endpoint)
-        logger.debug("SSE ROI_COORDS: %s (type=%s)", roi_coords, type(roi_coords).__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SSE ROI_COORDS: %s (type=%s)", roi_coords, type(roi_coords).__name__)
         if crop_meta["roi_applied"]:
             logger.info(
                 "SSE ROI applied: %sx%s → %sx%s",
@@ -285,7 +370,7 @@ def analyze_frame_stream():
             context = f"{roi_ctx}\n{context}" if context else roi_ctx
 
         # Create session and store image for subsequent chat messages
-        session_id = data.get("session_id") or session_store.create_session()
+        session_id = body.session_id or session_store.create_session()
         thread_id = session_store.get_thread_id(session_id)
         image_id = session_store.store_image(session_id, prepared_base64, "analysis frame")
 
@@ -421,7 +506,8 @@ def _handle_session_chat(data: dict) -> tuple:
     ), 200
 
 
-@analysis_bp.route("/chat-query", methods=["POST"])
+@analysis_bp.post("/chat-query")
+@limiter.limit(ANALYSIS_RATE_LIMIT)
 @auth_required
 def chat_query():
     """
@@ -449,7 +535,8 @@ def chat_query():
     Returns: JSON with conversational response
     """
     try:
-        data = request.get_json()
+        # cache=False: the multi-MB raw body is not kept alive beside the parsed dict
+        data = request.get_json(cache=False)
 
         if not data:
             return jsonify({"success": False, "error": "No data provided"}), 400
@@ -506,21 +593,32 @@ def chat_query():
                 full_context = f"{context}\n\nPregunta del usuario: {message}\n\n"
                 full_context += f"A continuación recibirás {len(frames)} imágenes. Analízalas TODAS y responde la pregunta.\n"
 
-                # Analyze each frame and collect responses
-                frame_analyses = []
-                for idx, frame_data in enumerate(frames, 1):
-                    frame_base64 = frame_data.get("frame", "")
-                    frame_desc = frame_data.get("description", f"Frame {idx}")
-
-                    # Analyze this frame
-                    frame_context = (
-                        f"{full_context}\n\nEstás analizando: {frame_desc} ({idx}/{len(frames)})"
+                frame_descs = [
+                    frame_data.get("description", f"Frame {idx}")
+                    for idx, frame_data in enumerate(frames, 1)
+                ]
+                frame_contexts = [
+                    f"{full_context}\n\nEstás analizando: {frame_desc} ({idx}/{len(frames)})"
+                    for idx, frame_desc in enumerate(frame_descs, 1)
+                ]
+
+                # Frames are independent LLM round-trips: fan them out so the
+                # request waits ~max(latency) instead of the sum; map() keeps order
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(len(frames), CHAT_PARALLEL_WORKERS))
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            vision_agent.analyze,
+                            [frame_data.get("frame", "") for frame_data in frames],
+                            frame_contexts,
+                        )
                     )
-                    result = vision_agent.analyze(frame_base64, frame_context)
-                    analysis = result.get("analysis", "Sin análisis")
 
-                    frame_analyses.append(f"**{frame_desc}**: {analysis}")
-                    logger.debug("   ✓ Frame %s analyzed", idx)
+                frame_analyses = [
+                    f"**{frame_desc}**: {result.get('analysis', 'Sin análisis')}"
+                    for frame_desc, result in zip(frame_descs, results, strict=True)
+                ]
 
                 # Combine all analyses
                 combined_response = "\n\n".join(frame_analyses)
@@ -540,21 +638,23 @@ def chat_query():
             frame_base64 = data["frame"]
             context = data.get("context", "")
 
-            # DEBUG: Log what we received
-            logger.debug("🔍 DEBUG chat-query received:")
-            logger.debug("   - frame type: %s", type(frame_base64).__name__)
-            logger.debug("   - frame is None: %s", frame_base64 is None)
-            if isinstance(frame_base64, dict):
-                logger.debug(
-                    "   - frame keys: %s", list(frame_base64.keys()) if frame_base64 else "empty"
-                )
-                logger.debug("   - frame preview: %s", str(frame_base64)[:200])
-            elif isinstance(frame_base64, str):
-                logger.debug("   - frame length: %s", len(frame_base64))
-                logger.debug(
-                    "   - frame starts with: %s",
-                    frame_base64[:50] if len(frame_base64) > 50 else frame_base64,
-                )
+            # DEBUG: Log what we received (guarded — previews slice the payload)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 DEBUG chat-query received:")
+                logger.debug("   - frame type: %s", type(frame_base64).__name__)
+                logger.debug("   - frame is None: %s", frame_base64 is None)
+                if isinstance(frame_base64, dict):
+                    logger.debug(
+                        "   - frame keys: %s",
+                        list(frame_base64.keys()) if frame_base64 else "empty",
+                    )
+                    logger.debug("   - frame preview: %s", str(frame_base64)[:200])
+                elif isinstance(frame_base64, str):
+                    logger.debug("   - frame length: %s", len(frame_base64))
+                    logger.debug(
+                        "   - frame starts with: %s",
+                        frame_base64[:50] if len(frame_base64) > 50 else frame_base64,
+                    )
 
             # Validate frame is a string (defensive against malformed payloads)
             if not isinstance(frame_base64, str):
@@ -610,7 +710,8 @@ def chat_query():
         return jsonify({"success": False, "error": "Internal chat error"}), 500
 
 
-@analysis_bp.route("/analyze-batch", methods=["POST"])
+@analysis_bp.post("/analyze-batch")
+@limiter.limit(ANALYSIS_RATE_LIMIT)
 @auth_required
 def analyze_batch():
     """
@@ -629,29 +730,13 @@ def analyze_batch():
     Returns: JSON with individual results and combined geolocation
     """
     try:
-        data = request.get_json()
-
-        if not data or "frames" not in data:
-            return jsonify({"success": False, "error": "No frames provided"}), 400
-
-        frames = data["frames"]
-        enable_context = data.get("enable_context_accumulation", True)
-
-        # Validate frames count
-        if not frames or len(frames) > 10:
-            return jsonify({"success": False, "error": "Provide between 1 and 10 frames"}), 400
-
-        # Validate each frame has base64 data
-        for idx, frame in enumerate(frames):
-            if "frame" not in frame:
-                return jsonify(
-                    {"success": False, "error": f"Frame {idx + 1} missing base64 data"}
-                ), 400
+        try:
+            body = AnalyzeBatchRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return validation_error_response(e, "No frames provided")
 
-            # Validate base64 size
-            is_valid, error_msg = validate_base64_size(frame["frame"])
-            if not is_valid:
-                return jsonify({"success": False, "error": f"Frame {idx + 1}: {error_msg}"}), 413
+        frames = body.frame_dicts()
+        enable_context = body.enable_context_accumulation
 
         logger.info(
             "🔍 Processing batch of %s frames (context_accumulation=%s)",
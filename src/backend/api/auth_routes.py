@@ -7,6 +7,7 @@ import logging
 from flask import Blueprint, jsonify, request
 
 from ..services.auth import auth_service
+from .rate_limit import AUTH_RATE_LIMIT, limiter
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,8 @@ logger = logging.getLogger(__name__)
 auth_bp = Blueprint("auth", __name__)
 
 
-@auth_bp.route("/login", methods=["POST"])
+@auth_bp.post("/login")
+@limiter.limit(AUTH_RATE_LIMIT)
 def login():
     """
     User login endpoint.
@@ -52,7 +54,8 @@ def login():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@auth_bp.route("/logout", methods=["POST"])
+@auth_bp.post("/logout")
+@limiter.limit(AUTH_RATE_LIMIT)
 def logout():
     """
     User logout endpoint.
@@ -0,0 +1,66 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Installed as ``app.json`` so every ``jsonify(...)`` and ``request.get_json()``
+goes through orjson's C encoder/decoder without touching the route code.
+Falls back to Flask's stdlib provider when orjson is not installed.
+"""
+
+import logging
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Non-str dict keys are coerced like the stdlib encoder does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson.
+
+    Types orjson does not know natively fall back to Flask's default
+    handler (dataclasses, ``__html__``, decimals). ``datetime`` values are
+    emitted as ISO 8601, matching the ``isoformat()`` strings the routes
+    already return.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return self._dump_bytes(obj, kwargs).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON document (request bodies arrive as bytes)."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response straight from orjson's bytes (no str round-trip)."""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._dump_bytes(obj, {"indent": 2} if pretty else {})
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    def _dump_bytes(self, obj: Any, kwargs: dict[str, Any]) -> bytes:
+        option = _ORJSON_OPTIONS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+
+def install_json_provider(app) -> None:
+    """Use orjson for the app's JSON encoding/decoding when available."""
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+        logger.info("⚡ JSON provider: orjson")
+    else:
+        logger.info("📦 orjson not installed — using the stdlib JSON provider")
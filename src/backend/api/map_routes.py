@@ -8,6 +8,7 @@ from flask import Blueprint, jsonify
 
 from ..config import MAPBOX_ACCESS_TOKEN
 from .middleware import auth_required
+from .rate_limit import MAP_RATE_LIMIT, limiter
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +16,13 @@ logger = logging.getLogger(__name__)
 map_bp = Blueprint("map", __name__)
 
 
-@map_bp.route("/mapbox-token", methods=["GET"])
+@map_bp.get("/mapbox-token")
+@limiter.limit(MAP_RATE_LIMIT)
 @auth_required
 def get_mapbox_token():
     """Serve Mapbox access token to the frontend.
 
-    Rate-limited to 5/min at the blueprint level (configured in app.py).
+    Rate-limited to 5/min (MAP_RATE_LIMIT in rate_limit.py).
     """
     if not MAPBOX_ACCESS_TOKEN:
         return jsonify({"success": False, "error": "Map service not configured"}), 503
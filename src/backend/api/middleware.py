@@ -35,7 +35,7 @@ def auth_required(f: Any) -> Any:
 
     Usage::
 
-        @analysis_bp.route("/analyze-frame", methods=["POST"])
+        @analysis_bp.post("/analyze-frame")
         @auth_required
         def analyze_frame():
             ...
@@ -4,30 +4,82 @@ Professional OSINT routes: metadata, PDF reports, evidence packages
 
 import io
 import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
+from typing import Any
 
 from flask import Blueprint, jsonify, request, send_file
 
-from ..services.metadata import metadata_service
-from ..services.report import report_service
+from ..config import METADATA_WORKERS
 from .middleware import auth_required
+from .rate_limit import PROFESSIONAL_RATE_LIMIT, limiter
 
 logger = logging.getLogger(__name__)
 
 # Blueprint
 professional_bp = Blueprint("professional", __name__)
 
+# metadata_service (PIL, piexif, ffmpeg) and report_service (reportlab) are
+# imported inside the handlers: workers that never serve these routes skip
+# their import cost at boot. Python caches the module after the first call.
+
+# Metadata extraction (base64 decode, PIL, EXIF, SHA-256) is CPU-bound and
+# would hold the serving worker's GIL; it runs in a process pool instead.
+# The pool uses the forkserver start method: forking a threaded/gevent worker
+# could copy held locks into the child, and forkserver children import only
+# the metadata module rather than inheriting the whole langchain app.
+# Created on first use; METADATA_WORKERS is the total, as there is one
+# serving worker process (see server.py).
+_metadata_pool: ProcessPoolExecutor | None = None
+_metadata_pool_lock = threading.Lock()
+
+
+def _get_metadata_pool() -> ProcessPoolExecutor:
+    """Return the shared metadata process pool, creating it on first use."""
+    global _metadata_pool  # noqa: PLW0603
+    with _metadata_pool_lock:
+        if _metadata_pool is None:
+            _metadata_pool = ProcessPoolExecutor(
+                max_workers=METADATA_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _metadata_pool
+
+
+def _run_in_metadata_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run ``fn(*args)`` in the metadata pool and wait for the result.
+
+    If a child process dies (e.g. OOM on a huge frame) the executor is
+    permanently broken; drop it so the next request builds a fresh pool,
+    then re-raise for the route to report.
+    """
+    global _metadata_pool  # noqa: PLW0603
+    pool = _get_metadata_pool()
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        with _metadata_pool_lock:
+            if _metadata_pool is pool:
+                _metadata_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
 
 def validate_base64_size(base64_string: str, max_mb: int = 10) -> tuple[bool, str | None]:
     """Validate base64 size"""
-    max_bytes = max_mb * 1024 * 1024
-    if len(base64_string) > max_bytes:
-        size_mb = len(base64_string) / (1024 * 1024)
-        return False, f"Frame too large ({size_mb:.1f}MB). Max allowed: {max_mb}MB"
+    size = len(base64_string)
+    if size > max_mb * 1024 * 1024:
+        return False, f"Frame too large ({size / (1024 * 1024):.1f}MB). Max allowed: {max_mb}MB"
     return True, None
 
 
-@professional_bp.route("/extract-metadata", methods=["POST"])
+@professional_bp.post("/extract-metadata")
+@limiter.limit(PROFESSIONAL_RATE_LIMIT)
 @auth_required
 def extract_metadata():
     """
@@ -55,8 +107,10 @@ def extract_metadata():
 
         logger.info("📊 Extracting metadata...")
 
+        from ..services.metadata import metadata_service  # noqa: PLC0415 - PIL/piexif on first use
+
         # Extract metadata
-        metadata = metadata_service.extract_image_metadata(frame_base64)
+        metadata = _run_in_metadata_pool(metadata_service.extract_image_metadata, frame_base64)
 
         logger.info("✅ Metadata extraction complete")
 
@@ -66,8 +120,13 @@ def extract_metadata():
         logger.error("❌ Metadata extraction error: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
+    except BrokenProcessPool as e:
+        logger.error("❌ Metadata worker process died: %s", e)
+        return jsonify({"success": False, "error": "Metadata extraction failed"}), 500
 
-@professional_bp.route("/generate-pdf-report", methods=["POST"])
+
+@professional_bp.post("/generate-pdf-report")
+@limiter.limit(PROFESSIONAL_RATE_LIMIT)
 @auth_required
 def generate_pdf_report():
     """
@@ -94,15 +153,16 @@ def generate_pdf_report():
 
         logger.info("📄 Generating PDF report...")
 
-        # Generate PDF
-        pdf_bytes = report_service.generate_analysis_report(
+        from ..services.report import report_service  # noqa: PLC0415 - reportlab on first use
+
+        # Generate PDF straight into the response body's buffer
+        pdf_io = io.BytesIO()
+        report_service.generate_analysis_report(
             analysis_results=analysis_results,
             metadata=metadata,
             evidence_id=evidence_id,
+            out=pdf_io,
         )
-
-        # Create file-like object
-        pdf_io = io.BytesIO(pdf_bytes)
         pdf_io.seek(0)
 
         timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
@@ -122,7 +182,8 @@ def generate_pdf_report():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@professional_bp.route("/generate-evidence-package", methods=["POST"])
+@professional_bp.post("/generate-evidence-package")
+@limiter.limit(PROFESSIONAL_RATE_LIMIT)
 @auth_required
 def generate_evidence_package():
     """
@@ -152,9 +213,11 @@ def generate_evidence_package():
 
         logger.info("📦 Generating evidence package...")
 
+        from ..services.metadata import metadata_service  # noqa: PLC0415 - PIL/piexif on first use
+
         # Generate evidence package
-        package = metadata_service.generate_evidence_package(
-            frame_base64=frame_base64, analysis_results=analysis_results
+        package = _run_in_metadata_pool(
+            metadata_service.generate_evidence_package, frame_base64, analysis_results
         )
 
         logger.info("✅ Evidence package generated: %s", package["evidence_id"])
@@ -164,3 +227,7 @@ def generate_evidence_package():
     except (ValueError, TypeError, KeyError) as e:
         logger.error("❌ Evidence package error: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
+
+    except BrokenProcessPool as e:
+        logger.error("❌ Evidence worker process died: %s", e)
+        return jsonify({"success": False, "error": "Evidence package generation failed"}), 500
@@ -0,0 +1,25 @@
+"""
+Shared Flask-Limiter instance.
+
+Lives outside app.py so route modules can attach their limits at decoration
+time (``@limiter.limit(...)`` on each view); app.py binds it with
+``limiter.init_app(app)``.
+"""
+
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+
+from ..config import RATE_LIMIT_PER_MINUTE, RATELIMIT_STORAGE_URI, RATELIMIT_STRATEGY
+
+# Per-route budgets, grouped by blueprint (security rule 21)
+ANALYSIS_RATE_LIMIT = "10 per minute"
+PROFESSIONAL_RATE_LIMIT = "20 per minute"
+AUTH_RATE_LIMIT = "5 per minute"
+MAP_RATE_LIMIT = "5 per minute"
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=[f"{RATE_LIMIT_PER_MINUTE} per minute"],
+    storage_uri=RATELIMIT_STORAGE_URI,  # memory:// by default; redis:// for multi-worker
+    strategy=RATELIMIT_STRATEGY,
+)
@@ -30,7 +30,7 @@ system_bp = Blueprint("system", __name__)
 video_service = VideoService()
 
 
-@system_bp.route("/health", methods=["GET"])
+@system_bp.get("/health")
 def health_check():
     """Health check endpoint with dependency verification."""
     # L-5: Verify critical dependencies beyond a simple "ok"
@@ -51,7 +51,7 @@ def health_check():
     )
 
 
-@system_bp.route("/upload-video", methods=["POST"])
+@system_bp.post("/upload-video")
 @auth_required
 def upload_video():
     """
@@ -88,7 +88,7 @@ def upload_video():
         return jsonify({"success": False, "error": "Upload processing failed"}), 500
 
 
-@system_bp.route("/metrics", methods=["GET"])
+@system_bp.get("/metrics")
 @auth_required
 def get_metrics():
     """Get agent metrics and cache statistics."""
@@ -118,7 +118,7 @@ def get_metrics():
 # =============================================================================
 
 
-@system_bp.route("/transcode-video", methods=["POST"])
+@system_bp.post("/transcode-video")
 @auth_required
 def transcode_video():
     """
@@ -176,7 +176,7 @@ def transcode_video():
         return jsonify({"success": False, "error": "Transcoding failed"}), 500
 
 
-@system_bp.route("/video/<filename>", methods=["GET"])
+@system_bp.get("/video/<filename>")
 def serve_video(filename: str):
     """
     Serve a video file from temporary storage.
@@ -3,24 +3,23 @@ Flask backend for Video Analysis Agent System.
 Main API server with Blueprint-based routes.
 """
 
+import gzip
 import logging
 import os
 import secrets
 
-from flask import Flask, send_from_directory
-from flask_cors import CORS
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
+from flask import Flask, request, send_from_directory
 
 # Import blueprints
 from .api import analysis_bp, auth_bp, map_bp, professional_bp, system_bp
+from .api.json_provider import install_json_provider
+from .api.rate_limit import limiter
 from .config import (
     ALLOWED_ORIGINS,
     FLASK_DEBUG,
-    FLASK_HOST,
-    FLASK_PORT,
     MAX_CONTENT_LENGTH,
-    RATE_LIMIT_PER_MINUTE,
+    RESPONSE_GZIP_LEVEL,
+    RESPONSE_GZIP_MIN_BYTES,
 )
 
 # Configure logging (following rule 19)
@@ -29,6 +28,10 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__, static_folder="../frontend/static", template_folder="../frontend")
 app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH  # Limit upload file size
+install_json_provider(app)  # orjson for jsonify()/get_json() when installed
+# "/api/health/" matches "/api/health" directly instead of costing a redirect round-trip.
+# Must be set before the blueprints register, since rules read it when bound.
+app.url_map.strict_slashes = False
 
 # H-3: Secret key from env var — required for session integrity and CSRF protection.
 # Falls back to a random secret (safe but sessions won't survive restarts).
@@ -39,25 +42,14 @@ else:
     app.secret_key = secrets.token_hex(32)
     logger.warning("⚠️ FLASK_SECRET_KEY not set — using random secret (sessions lost on restart)")
 
-# Configure CORS with restrictions (security baseline rule 01)
-CORS(
-    app,
-    resources={
-        r"/api/*": {
-            "origins": ALLOWED_ORIGINS,
-            "methods": ["GET", "POST"],
-            "allow_headers": ["Content-Type", "Authorization"],
-        }
-    },
-)
+# Configure CORS with restrictions (security baseline rule 01). The allow-list
+# is static, so matching is one frozenset lookup and header values are fixed here.
+_CORS_ORIGINS = frozenset(origin.strip() for origin in ALLOWED_ORIGINS if origin.strip())
+_CORS_ALLOW_METHODS = "GET, POST"
+_CORS_ALLOW_HEADERS = frozenset({"content-type", "authorization"})
 
-# Configure rate limiting (security rule 21)
-limiter = Limiter(
-    app=app,
-    key_func=get_remote_address,
-    default_limits=[f"{RATE_LIMIT_PER_MINUTE} per minute"],
-    storage_uri="memory://",  # In-memory for simplicity (use Redis for production)
-)
+# Configure rate limiting (security rule 21) — per-route limits live on the views
+limiter.init_app(app)
 
 # Register blueprints
 app.register_blueprint(system_bp, url_prefix="/api")
@@ -66,12 +58,6 @@ app.register_blueprint(professional_bp, url_prefix="/api")
 app.register_blueprint(auth_bp, url_prefix="/api/auth")
 app.register_blueprint(map_bp, url_prefix="/api")
 
-# Apply rate limiting to specific blueprints
-limiter.limit("10 per minute")(analysis_bp)
-limiter.limit("20 per minute")(professional_bp)
-limiter.limit("5 per minute")(auth_bp)
-limiter.limit("5 per minute")(map_bp)
-
 logger.info("🚀 Flask app initialized with blueprints")
 
 
@@ -106,7 +92,62 @@ def set_security_headers(response):
     return response
 
 
-@app.route("/")
+# Blueprints whose responses carry credentials (session token, Mapbox token)
+# are never compressed, so their size cannot leak secrets (BREACH).
+_GZIP_EXCLUDED_BLUEPRINTS = frozenset({"auth", "map"})
+
+
+@app.after_request
+def set_cors_headers(response):
+    """Allow cross-origin access to /api/* for the configured origins only."""
+    if not request.path.startswith("/api/"):
+        return response
+
+    response.vary.add("Origin")
+    origin = request.headers.get("Origin")
+    if origin not in _CORS_ORIGINS:
+        return response
+
+    response.headers["Access-Control-Allow-Origin"] = origin
+    if request.method == "OPTIONS":
+        # Preflight: answered by Flask's automatic OPTIONS view, headers added here
+        response.headers["Access-Control-Allow-Methods"] = _CORS_ALLOW_METHODS
+        requested = request.headers.get("Access-Control-Request-Headers", "")
+        allowed = [
+            header.strip()
+            for header in requested.split(",")
+            if header.strip().lower() in _CORS_ALLOW_HEADERS
+        ]
+        if allowed:
+            response.headers["Access-Control-Allow-Headers"] = ", ".join(allowed)
+    return response
+
+
+@app.after_request
+def gzip_json_response(response):
+    """Gzip large JSON API responses when the client accepts it."""
+    if (
+        response.mimetype != "application/json"
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or request.blueprint in _GZIP_EXCLUDED_BLUEPRINTS
+        or request.accept_encodings["gzip"] <= 0  # absent, or refused with q=0
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < RESPONSE_GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=RESPONSE_GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@app.get("/")
+@limiter.exempt  # static SPA shell, like /static/* (which Flask-Limiter exempts itself)
 def index():
     """Serve main frontend page."""
     return send_from_directory("../frontend", "index.html")
@@ -125,13 +166,7 @@ def internal_error(error):
     return {"success": False, "error": "Internal server error"}, 500
 
 
-def run_server():
-    """Run Flask development server."""
-    logger.info("🌐 Starting server on %s:%s", FLASK_HOST, FLASK_PORT)
-    logger.info("🔧 Debug mode: %s", FLASK_DEBUG)
-
-    app.run(host=FLASK_HOST, port=FLASK_PORT, debug=FLASK_DEBUG)
-
-
-if __name__ == "__main__":
-    run_server()
+# Compile Werkzeug's route matcher now (it is otherwise built lazily on the
+# first request) so no worker pays the rule-sorting cost on a live request.
+# Must stay below the last route registration — adding a rule resets it.
+app.url_map.update()
@@ -27,6 +27,12 @@ OPENAI_BASE_URL = os.getenv(
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5.1")
 OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "3000"))
 OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
+# Shared HTTP connection pool for every LLM call (one TLS session reused across agents).
+# Idle connections are kept longer than httpx's 5s default so that frames a few
+# seconds apart do not pay a fresh TCP + TLS handshake each time.
+OPENAI_HTTP_MAX_CONNECTIONS = int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "64"))
+OPENAI_HTTP_MAX_KEEPALIVE = int(os.getenv("OPENAI_HTTP_MAX_KEEPALIVE", "32"))
+OPENAI_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_HTTP_KEEPALIVE_EXPIRY", "30"))
 
 # Flask Configuration
 FLASK_ENV = os.getenv("FLASK_ENV", "development")
@@ -35,6 +41,15 @@ FLASK_DEBUG = os.getenv("FLASK_DEBUG", "False").lower() == "true"
 FLASK_HOST = os.getenv("FLASK_HOST", "0.0.0.0")
 FLASK_PORT = int(os.getenv("FLASK_PORT", "5000"))
 
+# WSGI server (non-debug) — gunicorn with a cooperative gevent worker so that
+# concurrent analyze/chat requests overlap their LLM round-trips.
+# Always one worker process: sessions and rate limits are process-local (server.py).
+WSGI_WORKER_CLASS = os.getenv("WSGI_WORKER_CLASS", "gevent")
+WSGI_TIMEOUT_SECONDS = int(os.getenv("WSGI_TIMEOUT_SECONDS", "300"))
+# Max concurrent connections (greenlets) in the worker. Each in-flight analysis
+# holds its multi-MB frame for the whole LLM round-trip, so this also bounds memory.
+WSGI_WORKER_CONNECTIONS = int(os.getenv("WSGI_WORKER_CONNECTIONS", "200"))
+
 # Video Configuration
 MAX_VIDEO_SIZE_MB = int(os.getenv("MAX_VIDEO_SIZE_MB", "100"))
 MAX_VIDEO_SIZE_BYTES = MAX_VIDEO_SIZE_MB * 1024 * 1024
@@ -49,6 +64,12 @@ ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:5000").split(",
 RATE_LIMIT_PER_MINUTE = int(
     os.getenv("RATE_LIMIT_PER_MINUTE", "30")
 )  # 30 requests per minute per IP
+# Rate-limit counter storage. memory:// is correct for the single WSGI worker;
+# point it at a shared backend (e.g. redis://host:6379) if limits must be
+# shared across several deployments behind one load balancer.
+RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+# moving-window counts the trailing 60s exactly (no 2x burst at fixed-window edges)
+RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "moving-window")
 
 # Authentication — set AUTH_ENABLED=True to enforce Bearer token auth on all endpoints
 # When False (default for local dev), endpoints are open. Enable for any exposed deployment.
@@ -67,9 +88,22 @@ AGENT_RETRY_MAX_ATTEMPTS = int(os.getenv("AGENT_RETRY_MAX_ATTEMPTS", "3"))  # Ma
 AGENT_RETRY_MIN_WAIT = float(os.getenv("AGENT_RETRY_MIN_WAIT", "2.0"))  # Min wait between retries
 AGENT_RETRY_MAX_WAIT = float(os.getenv("AGENT_RETRY_MAX_WAIT", "10.0"))  # Max wait between retries
 
+# Gzip for large JSON responses (analysis reports are 50-200 KB of repetitive text)
+RESPONSE_GZIP_MIN_BYTES = int(os.getenv("RESPONSE_GZIP_MIN_BYTES", "2048"))
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "4"))
+
+# Multi-frame chat — concurrent vision calls per request (I/O-bound LLM round-trips)
+CHAT_PARALLEL_WORKERS = int(os.getenv("CHAT_PARALLEL_WORKERS", "8"))
+
+# Professional routes — worker processes for CPU-bound metadata/forensics extraction.
+# Total for the server (it runs a single WSGI worker process), capped by CPU count.
+METADATA_WORKERS = int(os.getenv("METADATA_WORKERS", str(min(4, os.cpu_count() or 1))))
+
 # Caching Configuration
 CACHE_ENABLED = os.getenv("CACHE_ENABLED", "True").lower() == "true"
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "3600"))  # 1 hour default
+# Geocoding results barely change, and Nominatim's usage policy asks clients to cache
+GEOCODE_CACHE_TTL_SECONDS = int(os.getenv("GEOCODE_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
 
 # Circuit Breaker Configuration
 CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "True").lower() == "true"
@@ -1,5 +1,5 @@
 """
-Pydantic models for agent results validation.
+Pydantic models for agent results and API request validation.
 """
 
 from .agent_results import (
@@ -13,9 +13,13 @@ from .agent_results import (
     OCRResult,
     VisionResult,
 )
+from .requests import AnalyzeBatchRequest, AnalyzeFrameRequest, BatchFrame, RoiModel
 
 __all__ = [
     "AgentResults",
+    "AnalyzeBatchRequest",
+    "AnalyzeFrameRequest",
+    "BatchFrame",
     "ContextIntelResult",
     "DetectionResult",
     "FaceAnalysisResult",
@@ -23,5 +27,6 @@ __all__ = [
     "ForensicAnalysisResult",
     "GeolocationResult",
     "OCRResult",
+    "RoiModel",
     "VisionResult",
 ]
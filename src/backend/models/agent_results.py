@@ -6,6 +6,9 @@ Fields use generic ``dict`` / ``list`` types because the LLM response
 is parsed from free-text into dicts by each agent's response_parser —
 typed sub-models were defined historically but never wired up and have
 been removed to reduce dead code.
+
+Models are frozen: they are built once from an agent's dict and dumped,
+never mutated. Derive a changed copy with ``model_copy(update=...)``.
 """
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -24,7 +27,7 @@ class VisionResult(BaseModel):
     confidence: str | None = Field(default=None, description="Confidence level")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class OCRResult(BaseModel):
@@ -37,7 +40,7 @@ class OCRResult(BaseModel):
     confidence: str | None = Field(default=None, description="Confidence level")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class DetectionResult(BaseModel):
@@ -49,7 +52,7 @@ class DetectionResult(BaseModel):
     confidence: str | None = Field(default=None, description="Confidence level")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -118,7 +121,7 @@ class GeolocationResult(BaseModel):
     # Error handling
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -165,7 +168,7 @@ class FaceAnalysisResult(BaseModel):
     # Error handling
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -229,7 +232,7 @@ class ForensicAnalysisResult(BaseModel):
     # Error handling
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -295,7 +298,7 @@ class ContextIntelResult(BaseModel):
     # Error handling
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -331,7 +334,7 @@ class VehicleDetectionResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class WeaponDetectionResult(BaseModel):
@@ -361,7 +364,7 @@ class WeaponDetectionResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class CrowdAnalysisResult(BaseModel):
@@ -390,7 +393,7 @@ class CrowdAnalysisResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class ShadowAnalysisResult(BaseModel):
@@ -431,7 +434,7 @@ class ShadowAnalysisResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class InfrastructureAnalysisResult(BaseModel):
@@ -458,7 +461,7 @@ class InfrastructureAnalysisResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -501,7 +504,7 @@ class TemporalComparisonResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class NightVisionResult(BaseModel):
@@ -539,7 +542,7 @@ class NightVisionResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -578,7 +581,7 @@ class NATOSymbologyResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class MultiMonitorResult(BaseModel):
@@ -612,7 +615,7 @@ class MultiMonitorResult(BaseModel):
     limitations: list = Field(default_factory=list, description="Analysis limitations")
     error: str | None = Field(default=None, description="Error message if failed")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -644,7 +647,7 @@ class AgentResults(BaseModel):
     nato_symbology: NATOSymbologyResult | None = None
     multi_monitor: MultiMonitorResult | None = None
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
 
 class FinalReport(BaseModel):
@@ -654,4 +657,4 @@ class FinalReport(BaseModel):
     status: str = Field(description="Overall status")
     agents: AgentResults = Field(description="Results from all agents")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
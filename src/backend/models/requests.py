@@ -0,0 +1,93 @@
+"""
+Pydantic models for analysis request bodies.
+
+Handlers parse the raw body with ``model_validate_json`` so JSON decoding and
+the shape/size checks run in pydantic-core (Rust) in a single pass, instead
+of ``get_json()`` followed by per-field dict probing in Python.
+"""
+
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import PydanticCustomError
+
+from ..config import MAX_BASE64_SIZE_BYTES, MAX_BASE64_SIZE_MB
+from ..utils.image_utils import base64_payload_offset
+
+MAX_BATCH_FRAMES = 10
+
+
+def check_frame_size(frame: str) -> str:
+    """
+    Reject base64 frames whose decoded size exceeds MAX_BASE64_SIZE_BYTES.
+
+    H-8: Base64 encodes 3 bytes into 4 chars, so the decoded size is
+    compared rather than the character count (~33 % under-counting).
+    The optional data-URI prefix is skipped by offset, not sliced, and only
+    the head of the string is searched for it: O(1) in the frame size.
+    """
+    estimated_bytes = (len(frame) - base64_payload_offset(frame)) * 3 // 4
+    if estimated_bytes > MAX_BASE64_SIZE_BYTES:
+        raise PydanticCustomError(
+            "frame_too_large",
+            "Frame too large ({size_mb}MB). Max allowed: {max_mb}MB",
+            {"size_mb": f"{estimated_bytes / (1024 * 1024):.1f}", "max_mb": MAX_BASE64_SIZE_MB},
+        )
+    return frame
+
+
+FrameData = Annotated[str, AfterValidator(check_frame_size)]
+
+
+class RoiModel(BaseModel):
+    """Region of interest in source-frame pixels (canvas coords may be fractional)."""
+
+    x: int | float = 0
+    y: int | float = 0
+    width: int | float | None = None
+    height: int | float | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class AnalyzeFrameRequest(BaseModel):
+    """Body of /analyze-frame and /analyze-frame-stream."""
+
+    frame: FrameData
+    roi: RoiModel | None = None
+    context: str | None = ""
+    session_id: str | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+    @field_validator("context")
+    @classmethod
+    def _context_none_as_empty(cls, value: str | None) -> str:
+        """Treat an explicit ``null`` context like an omitted one."""
+        return value or ""
+
+    def roi_coords(self) -> dict | None:
+        """ROI as the dict ImageService expects (only the keys the client sent)."""
+        return self.roi.model_dump(exclude_unset=True) if self.roi else None
+
+
+class BatchFrame(BaseModel):
+    """One frame of an /analyze-batch request."""
+
+    frame: FrameData
+    description: str | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class AnalyzeBatchRequest(BaseModel):
+    """Body of /analyze-batch."""
+
+    frames: list[BatchFrame] = Field(min_length=1, max_length=MAX_BATCH_FRAMES)
+    enable_context_accumulation: bool = True
+
+    model_config = ConfigDict(extra="ignore")
+
+    def frame_dicts(self) -> list[dict[str, str]]:
+        """Frames as the plain dicts the coordinator consumes."""
+        return [frame.model_dump(exclude_none=True) for frame in self.frames]
@@ -0,0 +1,77 @@
+"""
+Server launcher for the WatchDogs API.
+
+Kept apart from app.py on purpose: with gevent workers the standard library
+must be monkey-patched *before* Flask, openai/httpx, ssl or urllib3 are
+imported. This module only reads configuration, so gunicorn imports
+``src.backend.app:app`` inside each worker, after the worker has patched.
+"""
+
+import logging
+
+from .config import (
+    FLASK_DEBUG,
+    FLASK_HOST,
+    FLASK_PORT,
+    WSGI_TIMEOUT_SECONDS,
+    WSGI_WORKER_CLASS,
+    WSGI_WORKER_CONNECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Login sessions, chat sessions, lockout counters, the auth JSON file and
+# memory:// rate-limit counters are all process-local, so the API is served by
+# ONE worker process. Concurrency comes from gevent greenlets inside it.
+WSGI_WORKERS = 1
+
+APP_IMPORT_PATH = "src.backend.app:app"
+
+
+def run_server():
+    """
+    Run the API server.
+
+    Debug mode keeps Flask's reloading development server. Otherwise the app
+    is served by gunicorn with a ``WSGI_WORKER_CLASS`` worker (gevent by
+    default) — every route group is I/O-bound, so cooperative greenlets let
+    concurrent LLM calls overlap instead of queuing behind one thread.
+    """
+    logger.info("🌐 Starting server on %s:%s", FLASK_HOST, FLASK_PORT)
+    logger.info("🔧 Debug mode: %s", FLASK_DEBUG)
+
+    if FLASK_DEBUG:
+        from .app import app  # noqa: PLC0415 - debug server only; gunicorn imports it per worker
+
+        app.run(host=FLASK_HOST, port=FLASK_PORT, debug=True)
+        return
+
+    from gunicorn.app.base import BaseApplication  # noqa: PLC0415 - not needed in debug mode
+    from gunicorn.util import import_app  # noqa: PLC0415 - not needed in debug mode
+
+    class _GunicornServer(BaseApplication):
+        """Embedded gunicorn runner; the app is imported lazily in the worker."""
+
+        def load_config(self):
+            self.cfg.set("bind", f"{FLASK_HOST}:{FLASK_PORT}")
+            self.cfg.set("worker_class", WSGI_WORKER_CLASS)
+            self.cfg.set("workers", WSGI_WORKERS)
+            self.cfg.set("worker_connections", WSGI_WORKER_CONNECTIONS)
+            self.cfg.set("timeout", WSGI_TIMEOUT_SECONDS)
+            self.cfg.set("accesslog", "-")
+            self.cfg.set("errorlog", "-")
+
+        def load(self):
+            return import_app(APP_IMPORT_PATH)
+
+    logger.info(
+        "⚙️ gunicorn: %s %s worker, %s connections",
+        WSGI_WORKERS,
+        WSGI_WORKER_CLASS,
+        WSGI_WORKER_CONNECTIONS,
+    )
+    _GunicornServer().run()
+
+
+if __name__ == "__main__":
+    run_server()
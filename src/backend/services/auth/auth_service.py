@@ -2,19 +2,57 @@
 Main authentication service orchestrator
 """
 
+import atexit
 import json
 import logging
 import os
 import secrets
+import tempfile
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 
 from .lockout_manager import LockoutManager
-from .password_handler import hash_password, validate_password_strength
+from .password_handler import (
+    hash_password,
+    needs_rehash,
+    validate_password_strength,
+    verify_password,
+)
 from .session_manager import SessionManager
+from .verification_cache import VerificationCache
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Login bookkeeping is batched: the users table is rewritten at most once per interval
+FLUSH_INTERVAL_SECONDS = float(os.getenv("AUTH_FLUSH_INTERVAL_SECONDS", "1.0"))
+# fsync each snapshot before it replaces the old file (once per flush, not per mutation)
+FSYNC_ENABLED = os.getenv("AUTH_FSYNC", "True").lower() == "true"
+
+# Role hierarchy: admin > analyst > viewer
+ROLE_LEVELS = {"admin": 3, "analyst": 2, "viewer": 1}
+
+
+def _encode_storage(data: dict) -> bytes:
+    """Serialize the storage document compactly (orjson's C encoder when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_storage(raw: bytes) -> dict:
+    """Parse the storage document (orjson's C decoder when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class AuthService:
     """Security-hardened authentication service"""
@@ -29,9 +67,19 @@ class AuthService:
         # In-memory user storage
         self.users: dict = {}
 
+        # Write batching: mutations mark the table dirty, a background thread flushes it
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
+
         # Managers
         self.session_manager = SessionManager()
         self.lockout_manager = LockoutManager()
+        self.verification_cache = VerificationCache()
+
+        # Unknown usernames are checked against this throwaway hash, so they cost
+        # the same key derivation as a wrong password (no user-enumeration timing)
+        self._dummy_hash, self._dummy_salt = hash_password(secrets.token_urlsafe(16))
 
         # Load from disk
         self._load_from_disk()
@@ -40,39 +88,88 @@ class AuthService:
         if not self.users:
             self._create_default_admin()
 
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="auth-storage-flush", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
     def _load_from_disk(self):
         """Load users from persistent storage"""
         try:
             if self.storage_path.exists():
-                with open(self.storage_path) as f:
-                    data = json.load(f)
-                    self.users = data.get("users", {})
-                    logger.info("✅ Loaded %s users from disk", len(self.users))
+                data = _decode_storage(self.storage_path.read_bytes())
+                self.users = data.get("users", {})
+                logger.info("✅ Loaded %s users from disk", len(self.users))
             else:
                 logger.info("📝 No existing auth storage found, starting fresh")
         except (ValueError, TypeError, KeyError) as e:
             logger.error("❌ Error loading auth storage: %s", e)
             self.users = {}
 
-    def _save_to_disk(self):
-        """Save users to persistent storage with restrictive permissions."""
+    def _save_to_disk(self) -> bool:
+        """
+        Save users to persistent storage with restrictive permissions.
+
+        The table is serialized compactly to bytes up front and written in a
+        single call to a temp file, fsynced, and renamed over the old one, so
+        a crash or power loss leaves either the old or the new table on disk,
+        never a truncated one.
+
+        Returns:
+            True if the table was written
+        """
         try:
+            payload = _encode_storage({"users": self.users})
+
             # Create directory if it doesn't exist
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # H-5: Write with restrictive permissions (owner read/write only).
-            # Use os.open + os.fdopen to set 0o600 atomically on creation.
-            fd = os.open(
-                str(self.storage_path),
-                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
-                0o600,
+            # H-5: mkstemp creates the file with 0o600 (owner read/write only)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.storage_path.parent, prefix=f".{self.storage_path.name}.", suffix=".tmp"
             )
-            with os.fdopen(fd, "w") as f:
-                json.dump({"users": self.users}, f, indent=2)
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                    if FSYNC_ENABLED:
+                        f.flush()
+                        os.fsync(f.fileno())
+                tmp_path.replace(self.storage_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             logger.debug("💾 Auth data saved to disk")
-        except (ValueError, TypeError, KeyError, OSError) as e:
+            return True
+        except (ValueError, TypeError, KeyError, OSError, RuntimeError) as e:
+            # RuntimeError: the table changed size mid-serialization; retried next flush
             logger.error("❌ Error saving auth storage: %s", e)
+            return False
+
+    def _mark_dirty(self):
+        """Schedule the users table for the next background flush."""
+        self._dirty = True
+
+    def _flush(self):
+        """Write the users table if it changed since the last write."""
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            if not self._save_to_disk():
+                self._dirty = True
+
+    def _flush_periodically(self):
+        """Background loop: flush pending changes every FLUSH_INTERVAL_SECONDS."""
+        while not self._stop_flusher.wait(FLUSH_INTERVAL_SECONDS):
+            self._flush()
+
+    def close(self):
+        """Stop the background flusher and write any pending changes."""
+        self._stop_flusher.set()
+        self._flush()
 
     def _create_default_admin(self):
         """Create default admin user from environment variables"""
@@ -123,7 +220,7 @@ class AuthService:
             return False, error_msg
 
         # Validate role
-        if role not in ["admin", "analyst", "viewer"]:
+        if role not in ROLE_LEVELS:
             return False, "Invalid role"
 
         # Hash password
@@ -142,8 +239,9 @@ class AuthService:
             "locked_until": None,
         }
 
-        # Save to disk
-        self._save_to_disk()
+        # Account creation is rare and must not be lost: write it through
+        self._mark_dirty()
+        self._flush()
 
         logger.info("✅ User registered: %s (%s)", username, role)
         return True, "User registered successfully"
@@ -163,13 +261,13 @@ class AuthService:
             Session token or None if authentication failed
         """
         # Check if user exists
-        if username not in self.users:
+        user = self.users.get(username)
+        if user is None:
+            # Don't reveal if user exists (security), not even through response time
+            verify_password(password, self._dummy_hash, self._dummy_salt)
             logger.warning("⚠️ Authentication attempt for non-existent user: %s", username)
-            # Don't reveal if user exists (security)
             return None
 
-        user = self.users[username]
-
         # Check if account is active
         if not user.get("is_active", True):
             logger.warning("⚠️ Authentication attempt for disabled user: %s", username)
@@ -180,15 +278,25 @@ class AuthService:
         if is_locked:
             return None
 
-        # Hash provided password with stored salt
-        hashed_pw, _ = hash_password(password, user["salt"])
-
-        # Compare hashes (constant-time comparison)
-        if not secrets.compare_digest(hashed_pw, user["password_hash"]):
-            logger.warning("⚠️ Failed login attempt for %s", username)
-            self.lockout_manager.record_failure(user, username)
-            self._save_to_disk()
-            return None
+        # Repeat logins with recently verified credentials skip the key-derivation round
+        if not self.verification_cache.is_verified(username, password, user["password_hash"]):
+            # Hash provided password with stored salt (constant-time comparison)
+            if not verify_password(password, user["password_hash"], user["salt"]):
+                logger.warning("⚠️ Failed login attempt for %s", username)
+                # Failure counts ride the batched flush; a new lockout is written
+                # through so a restart cannot lift it
+                locked = self.lockout_manager.record_failure(user, username)
+                self._mark_dirty()
+                if locked:
+                    self._flush()
+                return None
+
+            # Migrate legacy PBKDF2 hashes to scrypt while the plain password is at hand
+            if needs_rehash(user["password_hash"]):
+                user["password_hash"], user["salt"] = hash_password(password)
+                logger.info("🔐 Password hash upgraded to scrypt for %s", username)
+
+            self.verification_cache.remember(username, password, user["password_hash"])
 
         # Reset failed attempts on successful login
         self.lockout_manager.reset_attempts(user)
@@ -198,7 +306,7 @@ class AuthService:
 
         # Update last login
         user["last_login"] = datetime.now(UTC).isoformat()
-        self._save_to_disk()
+        self._mark_dirty()
 
         logger.info("✅ User authenticated: %s from IP %s", username, ip_address or "unknown")
         return session_token
@@ -220,11 +328,10 @@ class AuthService:
 
         Returns only safe, non-sensitive information.
         """
-        if username not in self.users:
+        user = self.users.get(username)
+        if user is None:
             return None
 
-        user = self.users[username]
-
         # Return ONLY safe public data
         return {
             "username": username,
@@ -235,23 +342,17 @@ class AuthService:
 
     def increment_analysis_count(self, username: str):
         """Increment user's analysis counter"""
-        if username in self.users:
-            self.users[username]["analysis_count"] = (
-                self.users[username].get("analysis_count", 0) + 1
-            )
-            self._save_to_disk()
+        user = self.users.get(username)
+        if user is not None:
+            user["analysis_count"] = user.get("analysis_count", 0) + 1
+            self._mark_dirty()
 
     def check_permission(self, role: str, required_role: str) -> bool:
         """
         Check if role has required permission.
         Role hierarchy: admin > analyst > viewer
         """
-        roles_hierarchy = {"admin": 3, "analyst": 2, "viewer": 1}
-
-        user_level = roles_hierarchy.get(role, 0)
-        required_level = roles_hierarchy.get(required_role, 0)
-
-        return user_level >= required_level
+        return ROLE_LEVELS.get(role, 0) >= ROLE_LEVELS.get(required_role, 0)
 
 
 # Global instance
@@ -28,8 +28,9 @@ class LockoutManager:
         # Check if account is locked
         if user_data.get("locked_until"):
             locked_until = datetime.fromisoformat(user_data["locked_until"])
-            if datetime.now(UTC) < locked_until:
-                remaining = (locked_until - datetime.now(UTC)).seconds // 60
+            now = datetime.now(UTC)
+            if now < locked_until:
+                remaining = (locked_until - now).seconds // 60
                 return True, f"Account locked. Try again in {remaining} minutes"
             # Unlock account
             user_data["locked_until"] = None
@@ -7,11 +7,43 @@ import secrets
 
 # Security constants
 MIN_PASSWORD_LENGTH = 12
+COMMON_PASSWORDS = frozenset({"password", "admin123", "watchdogs", "12345678"})
+
+# Character-class bits for validate_password_strength
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_HAS_ALL = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
+# scrypt cost parameters (RFC 7914 interactive-login profile: 16 MB per hash)
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+# Legacy hashes (bare hex, no "$" prefix) were PBKDF2-HMAC-SHA256
+LEGACY_PBKDF2_ITERATIONS = 100000
+
+
+def _scrypt(password: str, salt: str, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt.encode("utf-8"),
+        n=n,
+        r=r,
+        p=p,
+        maxmem=2 * 128 * n * r * p,
+        dklen=SCRYPT_DKLEN,
+    )
 
 
 def hash_password(password: str, salt: str | None = None) -> tuple[str, str]:
     """
-    Hash password with salt using PBKDF2-HMAC-SHA256.
+    Hash password with salt using scrypt.
+
+    The cost parameters are stored with the digest
+    (``scrypt$<n>$<r>$<p>$<hex>``) so they can be raised later without
+    invalidating existing hashes.
 
     Args:
         password: Plain text password
@@ -23,15 +55,40 @@ def hash_password(password: str, salt: str | None = None) -> tuple[str, str]:
     if not salt:
         salt = secrets.token_hex(32)
 
-    # Use PBKDF2 with 100,000 iterations (OWASP recommendation)
-    hashed = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt.encode("utf-8"),
-        100000,  # iterations
-    )
+    hashed = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${hashed.hex()}", salt
+
+
+def verify_password(password: str, password_hash: str, salt: str) -> bool:
+    """
+    Check a password against a stored hash (scrypt or legacy PBKDF2).
+
+    Args:
+        password: Plain text password
+        password_hash: Stored hash from ``hash_password`` or a legacy PBKDF2 hex digest
+        salt: Stored salt
+
+    Returns:
+        True if the password matches (constant-time comparison)
+    """
+    if password_hash.startswith("scrypt$"):
+        _, n, r, p, expected = password_hash.split("$")
+        hashed = _scrypt(password, salt, int(n), int(r), int(p))
+    else:
+        expected = password_hash
+        hashed = hashlib.pbkdf2_hmac(
+            "sha256",
+            password.encode("utf-8"),
+            salt.encode("utf-8"),
+            LEGACY_PBKDF2_ITERATIONS,
+        )
+
+    return secrets.compare_digest(hashed.hex(), expected)
+
 
-    return hashed.hex(), salt
+def needs_rehash(password_hash: str) -> bool:
+    """Return True if the hash predates the current algorithm or cost parameters."""
+    return not password_hash.startswith(f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -47,18 +104,29 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
             f"Password must be at least {MIN_PASSWORD_LENGTH} characters",
         )
 
-    if not any(c.isupper() for c in password):
+    # Single pass over the password, stopping once every class has been seen
+    classes = 0
+    for c in password:
+        if c.isupper():
+            classes |= _HAS_UPPER
+        elif c.islower():
+            classes |= _HAS_LOWER
+        elif c.isdigit():
+            classes |= _HAS_DIGIT
+        if classes == _HAS_ALL:
+            break
+
+    if not classes & _HAS_UPPER:
         return False, "Password must contain at least one uppercase letter"
 
-    if not any(c.islower() for c in password):
+    if not classes & _HAS_LOWER:
         return False, "Password must contain at least one lowercase letter"
 
-    if not any(c.isdigit() for c in password):
+    if not classes & _HAS_DIGIT:
         return False, "Password must contain at least one digit"
 
     # Check for common passwords (basic check)
-    common_passwords = ["password", "admin123", "watchdogs", "12345678"]
-    if password.lower() in common_passwords:
+    if password.lower() in COMMON_PASSWORDS:
         return False, "Password is too common"
 
     return True, ""
@@ -2,18 +2,32 @@
 Session management
 """
 
+import heapq
 import secrets
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import timedelta
 
 # Session duration
 SESSION_DURATION = timedelta(hours=24)
 
 
 class SessionManager:
-    """Manages user sessions"""
+    """
+    Manages user sessions.
+
+    Expiry times are also kept in a min-heap, so sweeping expired sessions
+    only touches the ones that actually expired instead of scanning them all.
+    The sweep runs opportunistically on create/validate. Logged-out sessions
+    are skipped lazily when their entry is popped, and the heap is rebuilt
+    once such stale entries outnumber the live sessions.
+
+    Sessions live only in memory, so expiry is tracked as ``time.monotonic()``
+    seconds: a float compare per validation, unaffected by wall-clock jumps.
+    """
 
     def __init__(self):
         self.sessions: dict[str, dict] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
 
     def create_session(self, username: str, role: str, ip_address: str | None = None) -> str:
         """
@@ -27,17 +41,21 @@ class SessionManager:
         Returns:
             Session token
         """
+        self.cleanup_expired()
+
         # Create session token (cryptographically secure)
         session_token = secrets.token_urlsafe(32)
 
         # Store session
+        expires_at = time.monotonic() + SESSION_DURATION.total_seconds()
         self.sessions[session_token] = {
             "username": username,
             "role": role,
-            "created_at": datetime.now(UTC),
-            "expires_at": datetime.now(UTC) + SESSION_DURATION,
+            "created_at": time.time(),
+            "expires_at": expires_at,
             "ip_address": ip_address,
         }
+        heapq.heappush(self._expiry_heap, (expires_at, session_token))
 
         return session_token
 
@@ -48,13 +66,15 @@ class SessionManager:
         Returns:
             Session data or None if invalid
         """
-        if session_token not in self.sessions:
-            return None
+        now = time.monotonic()
+        self.cleanup_expired(now)
 
-        session = self.sessions[session_token]
+        session = self.sessions.get(session_token)
+        if session is None:
+            return None
 
         # Check expiration
-        if datetime.now(UTC) > session["expires_at"]:
+        if now > session["expires_at"]:
             del self.sessions[session_token]
             return None
 
@@ -73,17 +93,42 @@ class SessionManager:
         Returns:
             True if session was found and deleted
         """
-        if session_token in self.sessions:
-            del self.sessions[session_token]
-            return True
-        return False
-
-    def cleanup_expired(self):
-        """Remove expired sessions"""
-        now = datetime.now(UTC)
-        expired = [token for token, session in self.sessions.items() if now > session["expires_at"]]
+        if self.sessions.pop(session_token, None) is None:
+            return False
+        self._compact_heap()
+        return True
+
+    def _compact_heap(self) -> None:
+        """Rebuild the expiry heap from live sessions once stale entries dominate it."""
+        # Amortised O(1) per logout: a rebuild costs O(n) and only happens after
+        # more than n entries went stale since the previous one
+        if len(self._expiry_heap) > 2 * len(self.sessions):
+            self._expiry_heap = [
+                (session["expires_at"], token) for token, session in self.sessions.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def cleanup_expired(self, now: float | None = None) -> int:
+        """
+        Remove expired sessions.
 
-        for token in expired:
-            del self.sessions[token]
+        Pops heap entries until the earliest remaining expiry is in the future:
+        O(k log n) for k expired sessions, O(1) when none have expired.
 
-        return len(expired)
+        Returns:
+            Number of sessions removed
+        """
+        if now is None:
+            now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] < now:
+            expires_at, token = heapq.heappop(heap)
+            session = self.sessions.get(token)
+            # Skip tokens already logged out (or re-issued with a later expiry)
+            if session is not None and session["expires_at"] == expires_at:
+                del self.sessions[token]
+                removed += 1
+
+        return removed
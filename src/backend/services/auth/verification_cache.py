@@ -0,0 +1,60 @@
+"""
+Short-lived cache of successful password verifications
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+# A repeat login with the same credentials inside this window skips key derivation
+VERIFIED_LOGIN_TTL_SECONDS = 30
+MAX_VERIFIED_ENTRIES = 1024
+
+
+class VerificationCache:
+    """
+    Remembers recent successful ``(username, password)`` verifications.
+
+    Page refreshes re-submit the same credentials within seconds; the first
+    login still pays the full scrypt cost, repeats inside the TTL do not.
+    Passwords are never stored — entries are keyed on an HMAC under a
+    per-process random key, and bound to the stored hash so a credential
+    change invalidates them.
+    """
+
+    def __init__(self, ttl_seconds: float = VERIFIED_LOGIN_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, bytes], tuple[str, float]] = OrderedDict()
+
+    def _fingerprint(self, username: str, password: str) -> tuple[str, bytes]:
+        digest = hmac.new(self._key, password.encode("utf-8"), hashlib.sha256).digest()
+        return username, digest
+
+    def is_verified(self, username: str, password: str, password_hash: str) -> bool:
+        """Return True if these credentials were verified against ``password_hash`` recently."""
+        key = self._fingerprint(username, password)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+
+            cached_hash, expires_at = entry
+            if time.monotonic() > expires_at or not hmac.compare_digest(cached_hash, password_hash):
+                del self._entries[key]
+                return False
+
+            return True
+
+    def remember(self, username: str, password: str, password_hash: str) -> None:
+        """Record a successful verification."""
+        key = self._fingerprint(username, password)
+        with self._lock:
+            self._entries[key] = (password_hash, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > MAX_VERIFIED_ENTRIES:
+                self._entries.popitem(last=False)
@@ -11,6 +11,9 @@ from typing import Any
 from geopy.exc import GeocoderServiceError, GeocoderTimedOut
 from geopy.geocoders import Nominatim
 
+from ..config import CACHE_ENABLED, GEOCODE_CACHE_TTL_SECONDS
+from ..utils.cache_utils import get_cached_result, set_cached_result
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,13 @@ class GeolocationService:
         Returns:
             Dict with location data or None if not found
         """
+        # Case/whitespace variants of an address share one Nominatim lookup
+        cache_key = f"geocode:{' '.join(address.lower().split())}"
+        if CACHE_ENABLED:
+            cached = get_cached_result(cache_key, GEOCODE_CACHE_TTL_SECONDS)
+            if cached is not None:
+                return cached
+
         try:
             logger.info("🔍 Geocoding address: %s", address)
 
@@ -47,6 +57,8 @@ class GeolocationService:
                     "raw": location.raw,
                 }
                 logger.info("✅ Geocoded: %s", location.address)
+                if CACHE_ENABLED:
+                    set_cached_result(cache_key, result, GEOCODE_CACHE_TTL_SECONDS)
                 return result
             logger.warning("⚠️ No results for: %s", address)
             return None
@@ -75,6 +87,13 @@ class GeolocationService:
         Returns:
             Dict with address data or None if not found
         """
+        # 5 decimals is ~1 m: finer differences resolve to the same address
+        cache_key = f"reverse_geocode:{latitude:.5f},{longitude:.5f}"
+        if CACHE_ENABLED:
+            cached = get_cached_result(cache_key, GEOCODE_CACHE_TTL_SECONDS)
+            if cached is not None:
+                return cached
+
         try:
             logger.info("🔍 Reverse geocoding: %s, %s", latitude, longitude)
 
@@ -92,6 +111,8 @@ class GeolocationService:
                     "raw": location.raw,
                 }
                 logger.info("✅ Reverse geocoded: %s", location.address)
+                if CACHE_ENABLED:
+                    set_cached_result(cache_key, result, GEOCODE_CACHE_TTL_SECONDS)
                 return result
             logger.warning("⚠️ No results for coordinates: %s, %s", latitude, longitude)
             return None
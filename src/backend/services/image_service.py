@@ -10,9 +10,50 @@ from io import BytesIO
 from PIL import Image, UnidentifiedImageError
 
 from ..exceptions import ImageProcessingError
+from ..utils.image_utils import base64_payload_offset
 
 logger = logging.getLogger(__name__)
 
+# Formats the vision LLM accepts as-is; anything else is re-encoded to JPEG.
+# GIF is excluded: comment blocks after the first frame stay invisible to PIL.
+_PASSTHROUGH_FORMATS = frozenset({"PNG", "JPEG", "WEBP"})
+
+# Re-encoded frames: the vision API downscales anything larger to fit 2048x2048
+# anyway, so larger pixels are only upload cost. Full-chroma JPEG keeps small
+# coloured text legible at a fraction of PNG's size and encode time.
+_MAX_ANALYSIS_SIDE = 2048
+_JPEG_SAVE_OPTIONS = {"quality": 90, "subsampling": 0}
+
+# Header fields that carry no personal data. Any other ``image.info`` key
+# (exif, xmp, comments, PNG text chunks...) forces the stripping re-encode.
+_PASSTHROUGH_SAFE_INFO_KEYS = frozenset(
+    {
+        "adobe",
+        "adobe_transform",
+        "aspect",
+        "background",
+        "dpi",
+        "duration",
+        "gamma",
+        "icc_profile",
+        "interlace",
+        "jfif",
+        "jfif_density",
+        "jfif_unit",
+        "jfif_version",
+        "loop",
+        "progression",
+        "progressive",
+        "srgb",
+        "transparency",
+        "version",
+    }
+)
+
+# JPEG segments without personal data: JFIF (APP0), ICC profile (APP2) and
+# Adobe colour transform (APP14). EXIF/XMP (APP1), IPTC (APP13) etc. re-encode.
+_PASSTHROUGH_SAFE_JPEG_MARKERS = frozenset({"APP0", "APP2", "APP14"})
+
 
 class ImageService:
     """Service for processing video frames and extracting regions of interest."""
@@ -32,15 +73,15 @@ class ImageService:
             ValueError: If decoding fails
         """
         try:
-            # Remove data URI prefix if present
-            if "," in base64_string:
-                base64_string = base64_string.split(",")[1]
-
-            image_data = base64.b64decode(base64_string)
+            # Skip the data-URI prefix by offset: one ASCII encode, then a
+            # zero-copy view, instead of split() + b64decode's own encode.
+            raw = base64_string.encode("ascii")
+            image_data = base64.b64decode(memoryview(raw)[base64_payload_offset(base64_string) :])
+            del raw
             image = Image.open(BytesIO(image_data))
-            logger.info("ℹ️ Image decoded successfully: %s", image.size)
+            logger.debug("ℹ️ Image decoded successfully: %s", image.size)
             return image
-        except binascii.Error as e:
+        except (binascii.Error, UnicodeEncodeError) as e:
             logger.error("❌ Invalid base64 encoding: %s", e)
             raise ValueError(f"Invalid base64 encoding: {e}") from e
         except UnidentifiedImageError as e:
@@ -74,7 +115,7 @@ class ImageService:
             bottom = min(y + height, img_height)
 
             cropped = image.crop((x, y, right, bottom))
-            logger.info("ℹ️ ROI cropped: %s", cropped.size)
+            logger.debug("ℹ️ ROI cropped: %s", cropped.size)
             return cropped
         except AttributeError as e:
             logger.error("❌ Invalid image object: %s", e)
@@ -96,8 +137,15 @@ class ImageService:
             Base64 encoded image string
         """
         try:
+            save_options = {}
+            if img_format.upper() in ("JPEG", "JPG"):
+                save_options = _JPEG_SAVE_OPTIONS
+                # JPEG has no alpha or palette: flatten to RGB (greyscale stays L)
+                if image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+
             buffer = BytesIO()
-            image.save(buffer, format=img_format)
+            image.save(buffer, format=img_format, **save_options)
             buffer.seek(0)
             base64_string = base64.b64encode(buffer.read()).decode("utf-8")
             return f"data:image/{img_format.lower()};base64,{base64_string}"
@@ -108,6 +156,32 @@ class ImageService:
             logger.error("❌ Invalid image format '%s': %s", img_format, e)
             raise ValueError(f"Invalid image format '{img_format}': {e}") from e
 
+    @staticmethod
+    def _can_pass_through(image: Image.Image) -> bool:
+        """
+        Check whether the decoded frame may be forwarded without re-encoding.
+
+        Only metadata-free images in a format the LLM accepts qualify; EXIF
+        (GPS, camera make), XMP or text chunks must never reach the LLM, and
+        the JPEG re-encode is what strips them.
+
+        The image is loaded first: PNG text/eXIf chunks placed after IDAT
+        only appear in ``image.info`` once the whole file has been read.
+        """
+        if image.format not in _PASSTHROUGH_FORMATS:
+            return False
+        try:
+            image.load()
+        except OSError:
+            # Truncated/corrupt data: let the re-encode path raise ImageProcessingError
+            return False
+        if not _PASSTHROUGH_SAFE_INFO_KEYS.issuperset(image.info):
+            return False
+        # JPEG APPn segments hold EXIF/XMP/IPTC even when PIL does not surface them in info
+        return _PASSTHROUGH_SAFE_JPEG_MARKERS.issuperset(
+            marker for marker, _ in getattr(image, "applist", [])
+        )
+
     @staticmethod
     def prepare_for_analysis(
         base64_frame: str, roi_coords: dict | None = None
@@ -135,7 +209,7 @@ class ImageService:
             width = roi_coords.get("width", image.width)
             height = roi_coords.get("height", image.height)
 
-            logger.info(
+            logger.debug(
                 "✂️ Cropping ROI: original %s → region x=%s y=%s w=%s h=%s",
                 image.size,
                 x,
@@ -145,13 +219,26 @@ class ImageService:
             )
 
             image = ImageService.crop_roi(image, x, y, width, height)
-
-            logger.info("✂️ Sending CROPPED image to agents: %s", image.size)
         else:
-            logger.info("📸 No ROI selected — sending FULL frame %s to agents", image.size)
-
-        # Convert to base64 for OpenAI
-        base64_for_api = ImageService.image_to_base64(image, img_format="PNG")
+            logger.debug("📸 No ROI selected — sending FULL frame %s to agents", image.size)
+
+        # Metadata-free full frame in a format the LLM accepts: forward the
+        # caller's base64 body. This skips the JPEG re-encode + base64 pass over
+        # a multi-MB frame.
+        # The data-URI prefix is rebuilt from the detected format (never trusted)
+        # and any line wrapping accepted by b64decode is removed.
+        if not roi_applied and ImageService._can_pass_through(image):
+            body = base64_frame[base64_payload_offset(base64_frame) :].strip()
+            if len(body.split(None, 1)) > 1:
+                body = "".join(body.split())
+            base64_for_api = f"data:image/{image.format.lower()};base64,{body}"
+        else:
+            # Bound the size, then convert to base64 for OpenAI (also strips EXIF
+            # and other metadata). thumbnail() never upscales and keeps the aspect.
+            if max(image.size) > _MAX_ANALYSIS_SIDE:
+                image.thumbnail((_MAX_ANALYSIS_SIDE, _MAX_ANALYSIS_SIDE), Image.Resampling.LANCZOS)
+                logger.debug("📐 Downscaled frame for analysis: %s", image.size)
+            base64_for_api = ImageService.image_to_base64(image, img_format="JPEG")
 
         metadata = {
             "roi_applied": roi_applied,
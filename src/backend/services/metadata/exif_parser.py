@@ -14,6 +14,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Common EXIF tags (built once at import, not on every parse)
+_EXIF_TAGS = {
+    271: "Make",
+    272: "Model",
+    274: "Orientation",
+    282: "XResolution",
+    283: "YResolution",
+    296: "ResolutionUnit",
+    305: "Software",
+    306: "DateTime",
+    36867: "DateTimeOriginal",
+    36868: "DateTimeDigitized",
+}
+
+# (output key, tag id) pairs read by piexif-based extractors
+_CAMERA_FIELDS = (("make", 271), ("model", 272), ("software", 305))  # 0th IFD
+_DATETIME_FIELDS = (("original", 36867), ("digitized", 36868))  # Exif IFD
+
 
 class ExifParser:
     """Parse EXIF data from images"""
@@ -21,46 +39,23 @@ class ExifParser:
     @staticmethod
     def parse_exif(exif_data: dict) -> dict[str, Any]:
         """Parse raw EXIF data"""
-        parsed = {}
-
-        # Common EXIF tags
-        tags = {
-            271: "Make",
-            272: "Model",
-            274: "Orientation",
-            282: "XResolution",
-            283: "YResolution",
-            296: "ResolutionUnit",
-            305: "Software",
-            306: "DateTime",
-            36867: "DateTimeOriginal",
-            36868: "DateTimeDigitized",
+        return {
+            name: str(exif_data[tag_id])
+            for tag_id, name in _EXIF_TAGS.items()
+            if tag_id in exif_data
         }
 
-        for tag_id, name in tags.items():
-            if tag_id in exif_data:
-                parsed[name] = str(exif_data[tag_id])
-
-        return parsed
-
     @staticmethod
     def extract_camera_info(exif_0th: dict) -> dict[str, str]:
         """Extract camera information from EXIF"""
         if not PIEXIF_AVAILABLE:
             return {}
 
-        camera = {}
-
-        if piexif.ImageIFD.Make in exif_0th:
-            camera["make"] = exif_0th[piexif.ImageIFD.Make].decode("utf-8", errors="ignore")
-
-        if piexif.ImageIFD.Model in exif_0th:
-            camera["model"] = exif_0th[piexif.ImageIFD.Model].decode("utf-8", errors="ignore")
-
-        if piexif.ImageIFD.Software in exif_0th:
-            camera["software"] = exif_0th[piexif.ImageIFD.Software].decode("utf-8", errors="ignore")
-
-        return camera
+        return {
+            key: exif_0th[tag_id].decode("utf-8", errors="ignore")
+            for key, tag_id in _CAMERA_FIELDS
+            if tag_id in exif_0th
+        }
 
     @staticmethod
     def extract_gps_info(gps_data: dict) -> dict[str, Any] | None:
@@ -128,12 +123,8 @@ class ExifParser:
         if not PIEXIF_AVAILABLE:
             return {}
 
-        datetime_info = {}
-
-        if piexif.ExifIFD.DateTimeOriginal in exif_data:
-            datetime_info["original"] = exif_data[piexif.ExifIFD.DateTimeOriginal].decode("utf-8")
-
-        if piexif.ExifIFD.DateTimeDigitized in exif_data:
-            datetime_info["digitized"] = exif_data[piexif.ExifIFD.DateTimeDigitized].decode("utf-8")
-
-        return datetime_info
+        return {
+            key: exif_data[tag_id].decode("utf-8")
+            for key, tag_id in _DATETIME_FIELDS
+            if tag_id in exif_data
+        }
@@ -17,6 +17,7 @@ try:
 except ImportError:
     METADATA_AVAILABLE = False
 
+from ...utils.image_utils import base64_payload_offset
 from .exif_parser import ExifParser
 from .video_extractor import VideoMetadataExtractor
 
@@ -54,11 +55,11 @@ class MetadataService:
         }
 
         try:
-            # Decode base64
-            if "," in image_base64:
-                image_base64 = image_base64.split(",")[1]
-
-            image_bytes = base64.b64decode(image_base64)
+            # Decode base64 — skip the data-URI prefix by offset and decode from a
+            # view instead of slicing a copy of the payload first
+            raw = image_base64.encode("ascii")
+            image_bytes = base64.b64decode(memoryview(raw)[base64_payload_offset(image_base64) :])
+            del raw
 
             # Calculate hashes for forensics (SHA-256 only — MD5 is cryptographically broken)
             metadata["forensics"]["sha256"] = hashlib.sha256(image_bytes).hexdigest()
@@ -74,13 +75,14 @@ class MetadataService:
             metadata["technical"]["width"] = image.size[0]
             metadata["technical"]["height"] = image.size[1]
 
-            # Extract EXIF if available
-            if hasattr(image, "_getexif") and image._getexif() is not None:
-                exif_data = image._getexif()
+            # Extract EXIF if available (_getexif re-parses the IFDs on every call)
+            exif_data = image._getexif() if hasattr(image, "_getexif") else None
+            if exif_data is not None:
                 metadata["exif"] = self.exif_parser.parse_exif(exif_data)
 
-            # Try piexif for more detailed EXIF
-            if METADATA_AVAILABLE:
+            # Try piexif for more detailed EXIF. PIL already isolated the APP1
+            # segment while reading the header, so piexif never scans the file.
+            if METADATA_AVAILABLE and "exif" in image.info:
                 try:
                     exif_dict = piexif.load(image.info.get("exif", b""))
 
@@ -65,13 +65,11 @@ class VideoMetadataExtractor:
             return metadata
 
         try:
-            # Get file hash — incremental to avoid loading entire file into RAM
-            sha256 = hashlib.sha256()
+            # Get file hash — file_digest streams through one reused buffer
+            # (readinto, no per-chunk bytes objects) with the GIL released
             file_size = os.path.getsize(video_path)
             with open(video_path, "rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
-                    sha256.update(chunk)
-            metadata["forensics"]["sha256"] = sha256.hexdigest()
+                metadata["forensics"]["sha256"] = hashlib.file_digest(f, "sha256").hexdigest()
             metadata["forensics"]["size_bytes"] = file_size
 
             # Use ffprobe to get metadata
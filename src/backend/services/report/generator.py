@@ -4,7 +4,7 @@ Main PDF report generator orchestrator
 
 import io
 import logging
-from typing import Any
+from typing import Any, BinaryIO
 
 try:
     from reportlab.lib.pagesizes import letter
@@ -14,7 +14,7 @@ try:
 except ImportError:
     REPORT_AVAILABLE = False
 
-from .sections import ReportSectionBuilder
+from .sections import ReportSectionBuilder, report_timestamp
 from .styles import get_report_styles
 
 logger = logging.getLogger(__name__)
@@ -39,7 +39,8 @@ class ReportService:
         analysis_results: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         evidence_id: str | None = None,
-    ) -> bytes:
+        out: BinaryIO | None = None,
+    ) -> bytes | None:
         """
         Generate comprehensive PDF report.
 
@@ -47,9 +48,10 @@ class ReportService:
             analysis_results: Results from multi-agent analysis
             metadata: Optional metadata from metadata_service
             evidence_id: Optional evidence ID for forensics
+            out: Optional binary stream to write the PDF into
 
         Returns:
-            PDF bytes
+            PDF bytes, or None when the PDF was written to ``out``
 
         Raises:
             RuntimeError: If report libraries not available
@@ -57,7 +59,7 @@ class ReportService:
         if not REPORT_AVAILABLE:
             raise RuntimeError("Report libraries not available")
 
-        buffer = io.BytesIO()
+        buffer = out if out is not None else io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
             pagesize=letter,
@@ -67,9 +69,12 @@ class ReportService:
             bottomMargin=18,
         )
 
+        # One generation time for the header, forensic table and footer
+        timestamp = report_timestamp()
+
         # Build all sections
         elements = []
-        elements.extend(self.section_builder.create_header(evidence_id))
+        elements.extend(self.section_builder.create_header(evidence_id, timestamp))
         elements.extend(self.section_builder.create_executive_summary(analysis_results))
         elements.extend(self.section_builder.create_technical_analysis(analysis_results))
 
@@ -101,14 +106,21 @@ class ReportService:
 
         if metadata and "forensics" in metadata:
             elements.extend(
-                self.section_builder.create_forensic_section(metadata["forensics"], evidence_id)
+                self.section_builder.create_forensic_section(
+                    metadata["forensics"], evidence_id, timestamp
+                )
             )
 
-        elements.extend(self.section_builder.create_footer())
+        elements.extend(self.section_builder.create_footer(timestamp))
 
         # Build PDF
         doc.build(elements)
 
+        # Written straight into the caller's stream: no getvalue() copy
+        if out is not None:
+            logger.info("📄 PDF report generated: %s bytes", out.tell())
+            return None
+
         pdf_bytes = buffer.getvalue()
         buffer.close()
 
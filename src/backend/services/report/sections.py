@@ -21,6 +21,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+REPORT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+def report_timestamp() -> str:
+    """Current UTC time as shown in reports (format once, reuse across sections)."""
+    return datetime.now(UTC).strftime(REPORT_TIMESTAMP_FORMAT)
+
+
 # =============================================================================
 # COLOR PALETTE FOR SECTIONS
 # =============================================================================
@@ -55,7 +63,7 @@ class ReportSectionBuilder:
         """
         self.styles = styles
 
-    def create_header(self, evidence_id: str | None) -> list:
+    def create_header(self, evidence_id: str | None, timestamp: str | None = None) -> list:
         """Create report header section"""
         elements = []
 
@@ -64,7 +72,7 @@ class ReportSectionBuilder:
         elements.append(title)
 
         # Metadata table
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+        timestamp = timestamp or report_timestamp()
 
         data = [
             ["Report Generated:", timestamp],
@@ -216,7 +224,9 @@ class ReportSectionBuilder:
 
         return elements
 
-    def create_forensic_section(self, forensics: dict[str, Any], evidence_id: str | None) -> list:
+    def create_forensic_section(
+        self, forensics: dict[str, Any], evidence_id: str | None, timestamp: str | None = None
+    ) -> list:
         """Create forensic evidence section"""
         elements = []
 
@@ -225,7 +235,7 @@ class ReportSectionBuilder:
         data = [
             ["SHA-256 Hash:", forensics.get("sha256", "N/A")],
             ["File Size:", f"{forensics.get('size_bytes', 0)} bytes"],
-            ["Timestamp:", datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")],
+            ["Timestamp:", timestamp or report_timestamp()],
         ]
 
         if evidence_id:
@@ -608,7 +618,7 @@ class ReportSectionBuilder:
 
         return elements
 
-    def create_footer(self) -> list:
+    def create_footer(self, timestamp: str | None = None) -> list:
         """Create report footer section"""
         elements = []
 
@@ -638,7 +648,7 @@ class ReportSectionBuilder:
         elements.append(Paragraph(disclaimer_text, self.styles["BodyText"]))
 
         # Footer text
-        footer_text = f"Generated by WatchDogs OSINT Platform v2.0 (CIA-Level) | {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        footer_text = f"Generated by WatchDogs OSINT Platform v2.0 (CIA-Level) | {timestamp or report_timestamp()}"
         footer = Paragraph(footer_text, self.styles["Normal"])
         elements.append(Spacer(1, 0.3 * inch))
         elements.append(footer)
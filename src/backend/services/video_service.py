@@ -3,8 +3,10 @@ Video processing service for handling video uploads, frame extraction,
 and automatic transcoding for browser-incompatible codecs (H.265/VP9 → H.264).
 """
 
+import io
 import logging
 import os
+import shutil
 import subprocess
 import time
 from pathlib import Path
@@ -26,6 +28,9 @@ MAX_VIDEO_SIZE_BYTES = MAX_VIDEO_SIZE_MB * 1024 * 1024
 # Codecs that HTML5 <video> can natively decode in all major browsers
 _BROWSER_COMPATIBLE_CODECS = frozenset({"h264", "vp8", "theora", "av1"})
 
+# Chunk size for upload copies (in-kernel sendfile or buffered fallback)
+_COPY_CHUNK_BYTES = 1 << 20
+
 # Max transcoding time (seconds) — 5 min covers ~100 MB with -preset fast
 _TRANSCODE_TIMEOUT_SECONDS = 300
 
@@ -118,6 +123,43 @@ class VideoService:
 
         return {"valid": True}
 
+    @staticmethod
+    def _write_upload(file: FileStorage, filepath: Path) -> None:
+        """
+        Copy the uploaded stream to ``filepath``.
+
+        Werkzeug spools uploads over 500 KB to an anonymous temp file, so the
+        bytes are moved file-to-file inside the kernel with ``os.sendfile``
+        instead of being read through Python; small in-memory uploads (or a
+        filesystem that refuses sendfile) use a buffered copy.
+        """
+        stream = file.stream
+        try:
+            src_fd = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            src_fd = None
+
+        with Path(filepath).open("wb") as dst:
+            if src_fd is not None and hasattr(os, "sendfile"):
+                offset = stream.tell()
+                remaining = os.fstat(src_fd).st_size - offset
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(
+                            dst.fileno(), src_fd, offset, min(remaining, _COPY_CHUNK_BYTES)
+                        )
+                        if sent == 0:
+                            break
+                        offset += sent
+                        remaining -= sent
+                    return
+                except OSError as e:
+                    logger.warning("⚠️ sendfile unavailable (%s), using buffered copy", e)
+                    dst.seek(0)
+                    dst.truncate()
+
+            shutil.copyfileobj(stream, dst, _COPY_CHUNK_BYTES)
+
     @staticmethod
     def save_video(file: FileStorage) -> dict[str, str | bool | float]:
         """
@@ -144,7 +186,7 @@ class VideoService:
             filepath = TEMP_VIDEO_PATH / filename
 
             # Save file
-            file.save(str(filepath))
+            VideoService._write_upload(file, filepath)
             logger.info("ℹ️ Video saved: %s", filepath)
 
             return {
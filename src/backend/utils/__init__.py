@@ -11,7 +11,7 @@ from .cache_utils import (
     set_cached_result,
 )
 from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, circuit_breaker
-from .image_utils import verify_image_size
+from .image_utils import base64_payload_offset, verify_image_size
 from .metrics_utils import _noop_decorator, get_agent_metrics, reset_metrics, track_agent_metrics
 from .retry_utils import agent_retry
 from .timeout_utils import AgentTimeoutError, TimeoutError, with_timeout
@@ -38,6 +38,7 @@ __all__ = [
     # Metrics utils
     "track_agent_metrics",
     # Image utils
+    "base64_payload_offset",
     "verify_image_size",
     # Timeout utils
     "with_timeout",
@@ -10,6 +10,25 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Longest data-URI header searched for ("data:image/svg+xml;base64," is 26 chars)
+_DATA_URI_PREFIX_MAX_CHARS = 256
+
+
+def base64_payload_offset(image_base64: str) -> int:
+    """
+    Index where the base64 payload starts (0 when there is no data-URI prefix).
+
+    Only the head of the string is searched, so a bare multi-MB payload is
+    not scanned end to end for a comma it does not contain.
+
+    Args:
+        image_base64: Base64 string, optionally with a ``data:...;base64,`` prefix
+
+    Returns:
+        Offset of the first payload character
+    """
+    return image_base64.find(",", 0, _DATA_URI_PREFIX_MAX_CHARS) + 1
+
 
 def verify_image_size(image_base64: str, agent_name: str = "Agent") -> tuple[int, int] | None:
     """
@@ -13,6 +13,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pytest
 from unittest.mock import Mock, patch
 
+from src.backend.agents.http_client import llm_http_client
+from src.backend.agents.ocr_agent import OCRAgent
+from src.backend.agents.vision_agent import VisionAgent
+
 
 # ---------------------------------------------------------------------------
 # Shared test base64 — long enough to pass get_image_hash validation (>=50 chars)
@@ -33,6 +37,12 @@ class TestVisionAgent:
             assert hasattr(agent, "llm")
             assert hasattr(agent, "analyze")
 
+    def test_agents_share_llm_http_client(self):
+        """Test agents reuse one pooled HTTP client instead of opening their own."""
+        vision_client = VisionAgent().llm.root_client._client
+        assert vision_client is llm_http_client
+        assert OCRAgent().llm.root_client._client is vision_client
+
     @patch("src.backend.agents.vision_agent.CACHE_ENABLED", False)
     @patch("src.backend.agents.vision_agent.CIRCUIT_BREAKER_ENABLED", False)
     @patch("src.backend.agents.vision_agent.ChatOpenAI")
@@ -11,13 +11,21 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import base64
+import gzip
 import json
+import subprocess
+import time
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import limits.storage.memory
 import pytest
 from PIL import Image
 
+from src.backend.api import professional_routes
 from src.backend.app import app
 
 
@@ -46,6 +54,33 @@ class TestAPIEndpoints:
         response = client.get("/")
         assert response.status_code in [200, 404]  # May fail if static files not in test env
 
+    def test_index_route_not_rate_limited(self, client):
+        """Test the SPA shell, like static assets, is outside the rate limiter."""
+        environ = {"REMOTE_ADDR": "203.0.113.11"}
+        statuses = {client.get("/", environ_base=environ).status_code for _ in range(35)}
+        assert 429 not in statuses
+
+    def test_cors_preflight_for_allowed_origin(self, client):
+        """Test preflight from an allow-listed origin gets CORS headers."""
+        response = client.options(
+            "/api/analyze-frame",
+            headers={
+                "Origin": "http://localhost:5000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type, Authorization, X-Debug",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:5000"
+        assert response.headers["Access-Control-Allow-Methods"] == "GET, POST"
+        assert response.headers["Access-Control-Allow-Headers"] == "Content-Type, Authorization"
+        assert "Origin" in response.headers["Vary"]
+
+    def test_cors_rejects_unknown_origin(self, client):
+        """Test other origins get no Access-Control-Allow-Origin header."""
+        response = client.get("/api/nonexistent", headers={"Origin": "https://evil.example"})
+        assert "Access-Control-Allow-Origin" not in response.headers
+
     def test_analyze_frame_missing_data(self, client):
         """Test analyze endpoint with missing frame data."""
         response = client.post(
@@ -128,6 +163,83 @@ class TestAPIEndpoints:
         assert "json" in data["results"]
         assert "text" in data["results"]
 
+    @patch("src.backend.api.analysis_routes.coordinator")
+    def test_analyze_frame_repeat_served_from_cache(self, mock_coordinator, client):
+        """Test resubmitting the same frame and context skips the agent run."""
+        mock_coordinator.analyze_frame.return_value = {
+            "json": {"status": "success", "agents": {}},
+            "text": "cached report",
+        }
+        payload = {"frame": _png_data_uri(40, 30), "context": "repeat-cache-test"}
+        environ = {"REMOTE_ADDR": "203.0.113.13"}
+
+        first = client.post("/api/analyze-frame", json=payload, environ_base=environ)
+        second = client.post("/api/analyze-frame", json=payload, environ_base=environ)
+        other = client.post(
+            "/api/analyze-frame",
+            json={**payload, "context": "another question"},
+            environ_base=environ,
+        )
+
+        assert first.status_code == second.status_code == other.status_code == 200
+        assert json.loads(second.data)["results"]["text"] == "cached report"
+        assert mock_coordinator.analyze_frame.call_count == 2
+
+    @patch("src.backend.api.analysis_routes.coordinator")
+    def test_analyze_frame_null_context_treated_as_empty(self, mock_coordinator, client):
+        """Test an explicit null context is accepted like an omitted one."""
+        mock_coordinator.analyze_frame.return_value = {"json": {}, "text": "report"}
+
+        response = client.post(
+            "/api/analyze-frame",
+            json={"frame": _png_data_uri(36, 20), "context": None},
+            environ_base={"REMOTE_ADDR": "203.0.113.14"},
+        )
+
+        assert response.status_code == 200
+        assert mock_coordinator.analyze_frame.call_args.args[1] == ""
+
+    @patch("src.backend.api.analysis_routes._chat_vision_agent")
+    def test_chat_query_multi_frame_keeps_frame_order(self, mock_vision_agent, client):
+        """Test concurrent multi-frame chat still answers in frame order."""
+        mock_vision_agent.analyze.side_effect = lambda frame, context: {"analysis": f"saw {frame}"}
+
+        response = client.post(
+            "/api/chat-query",
+            json={
+                "frames": [{"frame": f"f{i}", "description": f"View {i}"} for i in range(1, 5)],
+                "message": "Compara todas",
+            },
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["response"] == "\n\n".join(f"**View {i}**: saw f{i}" for i in range(1, 5))
+        assert mock_vision_agent.analyze.call_count == 4
+
+    def test_url_map_compiled_at_import(self):
+        """Test the route matcher is built at import, not on the first request."""
+        # Fresh interpreter: requests made by other tests would also compile it
+        project_root = Path(__file__).resolve().parent.parent
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from src.backend.app import app; print(app.url_map._remap)",
+            ],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    def test_trailing_slash_served_without_redirect(self, client):
+        """Test a trailing slash reaches the same view instead of a redirect."""
+        response = client.get("/api/health/", environ_base={"REMOTE_ADDR": "203.0.113.14"})
+        assert response.status_code == 200
+        assert "timestamp" in json.loads(response.data)
+
     def test_404_handler(self, client):
         """Test 404 error handler."""
         response = client.get("/api/nonexistent")
@@ -137,6 +249,161 @@ class TestAPIEndpoints:
         assert data["success"] is False
         assert "error" in data
 
+    @pytest.mark.parametrize(
+        ("payload", "status", "error"),
+        [
+            ({"frames": []}, 400, "Provide between 1 and 10 frames"),
+            ({"frames": [{"frame": "QUJD"}] * 11}, 400, "Provide between 1 and 10 frames"),
+            ({"frames": [{"frame": "QUJD"}, {"description": "x"}]}, 400, "Frame 2 missing"),
+            ({"frames": [{"frame": "A" * 8192}]}, 413, "Frame 1: Frame too large"),
+            ({"enable_context_accumulation": True}, 400, "No frames provided"),
+        ],
+    )
+    def test_analyze_batch_request_validation(self, client, monkeypatch, payload, status, error):
+        """Test batch body validation keeps the endpoint's error contract."""
+        monkeypatch.setattr("src.backend.models.requests.MAX_BASE64_SIZE_BYTES", 3 * 1024)
+
+        with patch("src.backend.api.analysis_routes.coordinator") as mock_coordinator:
+            response = client.post(
+                "/api/analyze-batch", json=payload, environ_base={"REMOTE_ADDR": "203.0.113.10"}
+            )
+
+        assert response.status_code == status
+        assert json.loads(response.data)["error"].startswith(error)
+        mock_coordinator.analyze_multi_frame.assert_not_called()
+
+    @patch("src.backend.api.analysis_routes.coordinator")
+    def test_large_json_response_gzipped(self, mock_coordinator, client):
+        """Test large JSON responses are gzipped only when the client accepts it."""
+        mock_coordinator.analyze_multi_frame.return_value = {"text": "Análisis del frame. " * 500}
+        request_kwargs = {
+            "json": {"frames": [{"frame": "QUJD"}]},
+            "environ_base": {"REMOTE_ADDR": "203.0.113.12"},
+        }
+
+        compressed = client.post(
+            "/api/analyze-batch", headers={"Accept-Encoding": "gzip, br"}, **request_kwargs
+        )
+        plain = client.post("/api/analyze-batch", **request_kwargs)
+        refused = client.post(
+            "/api/analyze-batch", headers={"Accept-Encoding": "br, gzip;q=0"}, **request_kwargs
+        )
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert int(compressed.headers["Content-Length"]) < len(plain.data) // 5
+        assert json.loads(gzip.decompress(compressed.data))["results"]["text"].startswith(
+            "Análisis"
+        )
+        assert "Content-Encoding" not in plain.headers
+        assert "Content-Encoding" not in refused.headers
+
+    def test_oversized_body_rejected_before_parsing(self, client, monkeypatch):
+        """Test bodies beyond the frame budget get 413 without reaching the view."""
+        monkeypatch.setattr("src.backend.api.analysis_routes.MAX_BASE64_SIZE_BYTES", 3 * 1024)
+        monkeypatch.setattr("src.backend.api.analysis_routes._REQUEST_OVERHEAD_BYTES", 0)
+
+        with patch("src.backend.api.analysis_routes.image_service") as mock_image_service:
+            response = client.post(
+                "/api/analyze-frame",
+                json={"frame": "A" * 8192},
+                environ_base={"REMOTE_ADDR": "203.0.113.9"},
+            )
+
+        assert response.status_code == 413
+        assert json.loads(response.data)["error"].startswith("Request too large")
+        mock_image_service.prepare_for_analysis.assert_not_called()
+
+    def test_rate_limit_counts_trailing_window(self, client, monkeypatch):
+        """Test the budget counts hits in the trailing minute, per client address."""
+        now = [time.time()]
+        monkeypatch.setattr(limits.storage.memory, "time", SimpleNamespace(time=lambda: now[0]))
+        environ = {"REMOTE_ADDR": "203.0.113.7"}
+
+        def login():
+            return client.post("/api/auth/login", json={}, environ_base=environ).status_code
+
+        statuses = [login()]
+        now[0] += 50
+        statuses += [login() for _ in range(4)]
+        # 61 s after the first hit a fixed window would have reset; the moving
+        # window has only dropped that first hit, so one more request fits
+        now[0] += 11
+        statuses += [login(), login()]
+        assert statuses == [400] * 6 + [429]
+
+        other = client.post("/api/auth/login", json={}, environ_base={"REMOTE_ADDR": "203.0.113.8"})
+        assert other.status_code == 400
+
+    def test_json_provider_matches_stdlib_output(self):
+        """Test the app JSON provider round-trips the shapes routes return."""
+        payload = {"success": True, "count": 3, "text": "Análisis", 1: [None, 1.5]}
+        with app.app_context():
+            body = app.json.response(payload).get_data()
+        assert json.loads(body) == {
+            "success": True,
+            "count": 3,
+            "text": "Análisis",
+            "1": [None, 1.5],
+        }
+        assert app.json.loads(body) == json.loads(body)
+
+
+def _png_data_uri(width=32, height=24):
+    """Build a small PNG data URI for request payloads."""
+    img = Image.new("RGB", (width, height), color="green")
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+class TestProfessionalEndpoints:
+    """Test suite for metadata/evidence routes served by the process pool."""
+
+    def test_extract_metadata(self, client):
+        """Test metadata extraction runs in the pool and returns forensics."""
+        response = client.post("/api/extract-metadata", json={"frame": _png_data_uri()})
+        assert response.status_code == 200
+
+        metadata = json.loads(response.data)["metadata"]
+        assert metadata["technical"]["size"] == "32x24"
+        assert len(metadata["forensics"]["sha256"]) == 64
+
+    def test_generate_evidence_package(self, client):
+        """Test evidence package generation runs in the pool."""
+        response = client.post(
+            "/api/generate-evidence-package",
+            json={"frame": _png_data_uri(), "analysis_results": {"vision": {}}},
+        )
+        assert response.status_code == 200
+
+        package = json.loads(response.data)["evidence_package"]
+        assert package["evidence_id"]
+        assert package["integrity"]["sha256"] == package["metadata"]["forensics"]["sha256"]
+
+    def test_generate_pdf_report(self, client):
+        """Test the PDF report is streamed back as an attachment."""
+        response = client.post(
+            "/api/generate-pdf-report",
+            json={"analysis_results": {"vision": {}}, "evidence_id": "abc123"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/pdf"
+        assert response.data.startswith(b"%PDF")
+        assert response.data.rstrip().endswith(b"%%EOF")
+
+    def test_broken_pool_is_reported_and_replaced(self, client):
+        """Test a crashed pool child yields a 500 and a fresh pool next time."""
+        broken_pool = Mock()
+        broken_pool.submit.return_value.result.side_effect = BrokenProcessPool("child died")
+
+        with patch.object(professional_routes, "_metadata_pool", broken_pool):
+            response = client.post("/api/extract-metadata", json={"frame": _png_data_uri()})
+            assert response.status_code == 500
+            assert json.loads(response.data)["success"] is False
+            assert professional_routes._metadata_pool is None
+
+        broken_pool.shutdown.assert_called_once()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,202 @@
+"""
+Unit tests for the authentication service.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import json
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.backend.services.auth import session_manager
+from src.backend.services.auth.auth_service import AuthService
+from src.backend.services.auth.password_handler import validate_password_strength
+from src.backend.services.auth.session_manager import SessionManager
+
+_PASSWORD = "CorrectHorse42Battery"
+
+
+@pytest.fixture
+def auth(tmp_path, monkeypatch):
+    """AuthService backed by a throwaway storage file with one analyst user."""
+    monkeypatch.setenv("ADMIN_PASSWORD", "AdminPassword123")
+    service = AuthService(storage_file=str(tmp_path / "auth.json"))
+    ok, _ = service.register_user("analyst1", _PASSWORD)
+    assert ok
+    return service
+
+
+class TestAuthenticate:
+    """Test suite for AuthService.authenticate."""
+
+    def test_valid_credentials_return_token(self, auth):
+        """Test successful login returns a session token."""
+        token = auth.authenticate("analyst1", _PASSWORD)
+        assert token
+        assert auth.validate_session(token) == {"username": "analyst1", "role": "analyst"}
+
+    def test_wrong_password_rejected(self, auth):
+        """Test wrong password is rejected and counted."""
+        assert auth.authenticate("analyst1", "WrongPassword99") is None
+        assert auth.users["analyst1"]["failed_login_attempts"] == 1
+
+    def test_unknown_user_pays_key_derivation(self, auth):
+        """Test unknown usernames run the same password check as wrong passwords."""
+        with patch(
+            "src.backend.services.auth.auth_service.verify_password", return_value=True
+        ) as mock_verify:
+            assert auth.authenticate("nobody", _PASSWORD) is None
+        mock_verify.assert_called_once_with(_PASSWORD, auth._dummy_hash, auth._dummy_salt)
+
+    def test_repeat_login_skips_password_hash(self, auth):
+        """Test a repeat login inside the TTL does not re-run key derivation."""
+        assert auth.authenticate("analyst1", _PASSWORD)
+
+        with patch("src.backend.services.auth.auth_service.verify_password") as mock_verify:
+            assert auth.authenticate("analyst1", _PASSWORD)
+            mock_verify.assert_not_called()
+
+    def test_cached_login_does_not_accept_other_password(self, auth):
+        """Test the verification cache never admits different credentials."""
+        assert auth.authenticate("analyst1", _PASSWORD)
+        assert auth.authenticate("analyst1", _PASSWORD + "x") is None
+
+    def test_legacy_pbkdf2_hash_upgraded_on_login(self, auth):
+        """Test a stored PBKDF2 hash still logs in and is rehashed with scrypt."""
+        salt = "legacy-salt"
+        legacy = hashlib.pbkdf2_hmac("sha256", _PASSWORD.encode(), salt.encode(), 100000)
+        auth.users["analyst1"].update(password_hash=legacy.hex(), salt=salt)
+
+        assert auth.authenticate("analyst1", _PASSWORD)
+        assert auth.users["analyst1"]["password_hash"].startswith("scrypt$16384$8$1$")
+        assert auth.users["analyst1"]["salt"] != salt
+
+        auth.verification_cache = type(auth.verification_cache)()
+        assert auth.authenticate("analyst1", _PASSWORD)
+        assert auth.authenticate("analyst1", "WrongPassword99") is None
+
+
+class TestPersistence:
+    """Test suite for batched writes of the users table."""
+
+    def test_login_is_persisted_by_flush_not_inline(self, auth):
+        """Test logins mark the table dirty and close() writes it out."""
+        auth._stop_flusher.set()  # keep the periodic flush out of the assertions
+        with patch.object(auth, "_save_to_disk", wraps=auth._save_to_disk) as mock_save:
+            for _ in range(3):
+                assert auth.authenticate("analyst1", _PASSWORD)
+            mock_save.assert_not_called()
+
+            auth.close()
+            mock_save.assert_called_once()
+
+        stored = json.loads(auth.storage_path.read_text())
+        assert stored["users"]["analyst1"]["last_login"] == auth.users["analyst1"]["last_login"]
+
+    def test_flush_fsyncs_snapshot_once(self, auth):
+        """Test a batch of mutations costs one fsync, and no temp file is left behind."""
+        auth._stop_flusher.set()
+        for _ in range(5):
+            auth.increment_analysis_count("analyst1")
+
+        with patch("src.backend.services.auth.auth_service.os.fsync") as mock_fsync:
+            auth.close()
+
+        mock_fsync.assert_called_once()
+        assert not list(auth.storage_path.parent.glob("*.tmp"))
+        assert (
+            json.loads(auth.storage_path.read_bytes())["users"]["analyst1"]["analysis_count"] == 5
+        )
+
+    def test_reload_reads_compact_and_legacy_indented_files(self, auth, tmp_path):
+        """Test a fresh service loads both the current and the old indented format."""
+        assert AuthService(storage_file=str(auth.storage_path)).users == auth.users
+
+        legacy_path = tmp_path / "legacy.json"
+        legacy_path.write_text(json.dumps({"users": auth.users}, indent=2))
+        assert AuthService(storage_file=str(legacy_path)).users == auth.users
+
+    def test_failures_batched_until_lockout(self, auth):
+        """Test failed attempts are not written one by one, but a lockout is."""
+        auth._stop_flusher.set()
+        with patch.object(auth, "_save_to_disk", wraps=auth._save_to_disk) as mock_save:
+            for _ in range(4):
+                assert auth.authenticate("analyst1", "WrongPassword99") is None
+            mock_save.assert_not_called()
+
+            assert auth.authenticate("analyst1", "WrongPassword99") is None
+            mock_save.assert_called_once()
+
+        stored = json.loads(auth.storage_path.read_bytes())["users"]["analyst1"]
+        assert stored["locked_until"] is not None
+
+    def test_registration_written_through(self, auth):
+        """Test a new account is on disk immediately, with owner-only permissions."""
+        raw = auth.storage_path.read_bytes()
+        assert json.loads(raw)["users"]["analyst1"]["role"] == "analyst"
+        assert b"\n" not in raw  # compact, not indent=2
+        assert auth.storage_path.stat().st_mode & 0o777 == 0o600
+
+
+class TestPasswordStrength:
+    """Test suite for password strength validation."""
+
+    @pytest.mark.parametrize(
+        ("password", "error"),
+        [
+            ("Short1", "at least 12 characters"),
+            ("alllowercase12", "uppercase letter"),
+            ("ALLUPPERCASE12", "lowercase letter"),
+            ("NoDigitsHereAtAll", "digit"),
+            ("ÑandúPassword12", ""),
+            (_PASSWORD, ""),
+        ],
+    )
+    def test_character_classes(self, password, error):
+        """Test each missing character class is reported (non-ASCII letters count)."""
+        is_valid, message = validate_password_strength(password)
+        assert is_valid is (error == "")
+        assert message.endswith(error)
+
+
+class TestSessionManager:
+    """Test suite for session expiry."""
+
+    def test_expired_sessions_swept_without_revalidation(self, monkeypatch):
+        """Test abandoned expired sessions are dropped when new ones are created."""
+        manager = SessionManager()
+        monkeypatch.setattr(session_manager, "SESSION_DURATION", timedelta(seconds=-1))
+        abandoned = [manager.create_session(f"user{i}", "viewer") for i in range(3)]
+        monkeypatch.undo()
+
+        live = manager.create_session("analyst1", "analyst")
+
+        assert set(manager.sessions) == {live}
+        assert all(manager.validate_session(token) is None for token in abandoned)
+        assert manager.validate_session(live) == {"username": "analyst1", "role": "analyst"}
+
+    def test_logged_out_sessions_not_expired_twice(self):
+        """Test logouts leave no heap entries behind to be processed on expiry."""
+        manager = SessionManager()
+        tokens = [manager.create_session(f"user{i}", "viewer") for i in range(4)]
+
+        assert all(manager.logout(token) for token in tokens[:3])
+        assert manager.logout(tokens[0]) is False
+        assert manager._expiry_heap == [(manager.sessions[tokens[3]]["expires_at"], tokens[3])]
+
+        later = time.monotonic() + session_manager.SESSION_DURATION.total_seconds() + 1
+        assert manager.cleanup_expired(later) == 1
+        assert manager.sessions == {}
+        assert manager._expiry_heap == []
+        assert manager.cleanup_expired(later) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
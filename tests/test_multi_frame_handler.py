@@ -92,3 +92,27 @@ def test_analyze_multi_frame_returns_identical_schema_for_both_modes() -> None:
         "context_accumulation_enabled",
     }
     assert set(parallel["json"].keys()) == set(sequential["json"].keys())
+
+
+def test_analyze_multi_frame_analyzes_identical_frames_once() -> None:
+    """Byte-identical frames should reuse one analysis in both modes."""
+    frames = [
+        {"frame": "img:1", "description": "Cruce"},
+        {"frame": "img:2", "description": "Semaforo"},
+        {"frame": "img:1", "description": "Cruce otra vez"},
+    ]
+
+    for enable_context in (True, False):
+        contexts: list[str] = []
+        handler = MultiFrameHandler(_build_analyzer_with_trace(contexts))
+
+        response = handler.analyze_multi_frame(frames, enable_context_accumulation=enable_context)
+
+        results = response["json"]["individual_results"]
+        assert len(contexts) == 2
+        assert response["json"]["total_frames"] == 3
+        assert [r["frame_index"] for r in results] == [1, 2, 3]
+        assert results[2]["description"] == "Cruce otra vez"
+        assert results[2]["duplicate_of"] == 1
+        assert results[2]["result"] == results[0]["result"]
+        assert "duplicate_of" not in results[1]
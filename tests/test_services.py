@@ -7,10 +7,28 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pytest
+import base64
+import hashlib
+import struct
+import tempfile
+import zlib
 from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
 from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from src.backend.services import geolocation_service, video_service
+from src.backend.services.geolocation_service import GeolocationService
 from src.backend.services.image_service import ImageService
+from src.backend.services.metadata.exif_parser import ExifParser
+from src.backend.services.metadata.metadata_service import MetadataService
+from src.backend.services.report import generator, sections
+from src.backend.services.report.generator import ReportService
+from src.backend.services.video_service import VideoService
+from src.backend.utils.cache_utils import clear_cache
+from src.backend.utils.image_utils import base64_payload_offset
 
 
 class TestImageService:
@@ -30,8 +48,6 @@ class TestImageService:
         img, buffer = self.create_test_image()
 
         # Convert to base64
-        import base64
-
         b64_data = base64.b64encode(buffer.read()).decode("utf-8")
         b64_string = f"data:image/png;base64,{b64_data}"
 
@@ -45,6 +61,18 @@ class TestImageService:
         with pytest.raises(ValueError):
             ImageService.decode_base64_image("invalid_base64")
 
+    def test_decode_base64_non_ascii_rejected(self):
+        """Test non-ASCII payloads raise ValueError rather than leaking an encode error."""
+        with pytest.raises(ValueError, match="Invalid base64"):
+            ImageService.decode_base64_image("data:image/png;base64,ñññ")
+
+    def test_base64_payload_offset(self):
+        """Test the data-URI prefix is located only within the string's head."""
+        assert base64_payload_offset("data:image/png;base64,QUJD") == len("data:image/png;base64,")
+        assert base64_payload_offset("QUJD") == 0
+        # A comma deep inside a bare payload is not mistaken for a prefix
+        assert base64_payload_offset("A" * 4096 + ",QUJD") == 0
+
     def test_crop_roi(self):
         """Test ROI cropping."""
         img, _ = self.create_test_image(200, 200)
@@ -76,8 +104,6 @@ class TestImageService:
         img, buffer = self.create_test_image()
         buffer.seek(0)
 
-        import base64
-
         b64_data = base64.b64encode(buffer.read()).decode("utf-8")
         b64_string = f"data:image/png;base64,{b64_data}"
 
@@ -90,13 +116,73 @@ class TestImageService:
         assert meta["original_size"] == {"width": 100, "height": 100}
         assert meta["analysis_size"] == {"width": 100, "height": 100}
 
+    def test_prepare_for_analysis_full_frame_passthrough(self):
+        """Test full-frame preparation forwards the original payload without re-encoding."""
+        img = Image.new("RGB", (64, 48), color="blue")
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG")
+        b64_string = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+        # Mislabelled prefix and MIME line wrapping must not reach the LLM
+        body = base64.b64encode(buffer.getvalue()).decode()
+        wrapped = "data:image/png;base64," + "\n".join(
+            body[i : i + 76] for i in range(0, len(body), 76)
+        )
+
+        _, prepared_b64, meta = ImageService.prepare_for_analysis(wrapped)
+
+        assert prepared_b64 == b64_string
+        assert meta["analysis_size"] == {"width": 64, "height": 48}
+
+    def test_prepare_for_analysis_strips_exif(self):
+        """Test full frames carrying EXIF are re-encoded instead of forwarded."""
+        img = Image.new("RGB", (64, 48), color="blue")
+        exif = Image.Exif()
+        exif[271] = "TestCameraMake"  # Make
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", exif=exif)
+        b64_string = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+        _, prepared_b64, _ = ImageService.prepare_for_analysis(b64_string)
+
+        assert prepared_b64.startswith("data:image/jpeg;base64,")
+        decoded = base64.b64decode(prepared_b64.split(",", 1)[1])
+        assert b"TestCameraMake" not in decoded
+
+    @pytest.mark.parametrize("chunk_type", [b"eXIf", b"tEXt"])
+    def test_prepare_for_analysis_strips_trailing_png_chunks(self, chunk_type):
+        """Test PNG metadata chunks placed after IDAT are not forwarded."""
+        buffer = BytesIO()
+        Image.new("RGB", (64, 48), color="blue").save(buffer, format="PNG")
+        png = buffer.getvalue()
+        if chunk_type == b"eXIf":
+            exif = Image.Exif()
+            exif[271] = "CanonSecretMake"  # Make
+            data = exif.tobytes()
+        else:
+            data = b"Comment\x00CanonSecretMake"
+        chunk = (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+        iend = png.rindex(b"IEND") - 4
+        b64_string = (
+            "data:image/png;base64," + base64.b64encode(png[:iend] + chunk + png[iend:]).decode()
+        )
+
+        _, prepared_b64, _ = ImageService.prepare_for_analysis(b64_string)
+
+        assert prepared_b64.startswith("data:image/jpeg;base64,")
+        decoded = base64.b64decode(prepared_b64.split(",", 1)[1])
+        assert b"CanonSecretMake" not in decoded
+
     def test_prepare_for_analysis_with_roi(self):
         """Test frame preparation with ROI."""
         img, buffer = self.create_test_image(200, 200)
         buffer.seek(0)
 
-        import base64
-
         b64_data = base64.b64encode(buffer.read()).decode("utf-8")
         b64_string = f"data:image/png;base64,{b64_data}"
 
@@ -109,7 +195,132 @@ class TestImageService:
         assert meta["original_size"] == {"width": 200, "height": 200}
         assert meta["analysis_size"] == {"width": 100, "height": 100}
         assert meta["roi_coords"] == roi_coords
-        assert prepared_b64.startswith("data:image/png;base64,")
+        assert prepared_b64.startswith("data:image/jpeg;base64,")
+
+    def test_prepare_for_analysis_bounds_reencoded_size(self):
+        """Test re-encoded frames are downscaled to the vision API's 2048px bound."""
+        img = Image.new("RGBA", (4096, 1024), color=(0, 128, 255, 255))
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+        b64_string = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+        roi = {"x": 0, "y": 0, "width": 3000, "height": 1024}
+        prepared_img, prepared_b64, meta = ImageService.prepare_for_analysis(b64_string, roi)
+
+        assert prepared_img.size == (2048, 699)
+        assert meta["analysis_size"] == {"width": 2048, "height": 699}
+        sent = Image.open(BytesIO(base64.b64decode(prepared_b64.split(",", 1)[1])))
+        assert (sent.format, sent.mode, sent.size) == ("JPEG", "RGB", (2048, 699))
+
+
+class TestVideoService:
+    """Test suite for Video Service uploads."""
+
+    _MP4_BYTES = b"\x00\x00\x00\x1cftypisom" + bytes(range(256)) * 8192
+
+    @pytest.mark.parametrize("spooled", [True, False])
+    def test_save_video_copies_upload(self, tmp_path, monkeypatch, spooled):
+        """Test spooled (sendfile) and in-memory uploads are saved byte-for-byte."""
+        monkeypatch.setattr(video_service, "TEMP_VIDEO_PATH", tmp_path)
+        with tempfile.TemporaryFile() if spooled else BytesIO() as stream:
+            stream.write(self._MP4_BYTES)
+            stream.seek(0)
+            result = VideoService.save_video(FileStorage(stream=stream, filename="clip.mp4"))
+
+        assert result["success"] is True
+        assert (tmp_path / result["filename"]).read_bytes() == self._MP4_BYTES
+
+
+class TestGeolocationService:
+    """Test suite for Nominatim lookups."""
+
+    def test_repeat_lookups_served_from_cache(self, monkeypatch):
+        """Test equivalent addresses and nearby coordinates hit Nominatim once each."""
+        monkeypatch.setattr(geolocation_service, "CACHE_ENABLED", True)
+        clear_cache()
+        service = GeolocationService()
+        location = Mock(
+            address="Puerta del Sol, Madrid", latitude=40.4169, longitude=-3.7035, raw={}
+        )
+        service.geolocator = Mock(
+            geocode=Mock(return_value=location), reverse=Mock(return_value=location)
+        )
+
+        first = service.geocode_address("Puerta del Sol, Madrid")
+        assert service.geocode_address("  puerta del sol,   MADRID ") == first
+        assert service.reverse_geocode(40.416901, -3.703502) == service.reverse_geocode(
+            40.416899, -3.703498
+        )
+
+        assert service.geolocator.geocode.call_count == 1
+        assert service.geolocator.reverse.call_count == 1
+        clear_cache()
+
+
+class TestMetadataService:
+    """Test suite for image metadata extraction."""
+
+    def test_extract_image_metadata_hashes_decoded_bytes(self):
+        """Test bare and data-URI payloads hash the same decoded image bytes."""
+        buffer = BytesIO()
+        Image.new("RGB", (32, 16), color="green").save(buffer, format="JPEG")
+        body = base64.b64encode(buffer.getvalue()).decode()
+        service = MetadataService()
+
+        bare = service.extract_image_metadata(body)
+        prefixed = service.extract_image_metadata(f"data:image/jpeg;base64,{body}")
+
+        expected = {
+            "sha256": hashlib.sha256(buffer.getvalue()).hexdigest(),
+            "size_bytes": len(buffer.getvalue()),
+        }
+        assert bare["forensics"] == prefixed["forensics"] == expected
+        assert prefixed["technical"]["size"] == "32x16"
+
+    def test_extract_image_metadata_reads_exif(self):
+        """Test EXIF is parsed by both PIL and piexif, and absent EXIF is skipped."""
+        exif = Image.Exif()
+        exif[271] = "TestCameraMake"  # Make
+        buffer = BytesIO()
+        Image.new("RGB", (32, 16)).save(buffer, format="JPEG", exif=exif)
+        service = MetadataService()
+
+        metadata = service.extract_image_metadata(base64.b64encode(buffer.getvalue()).decode())
+        assert metadata["exif"]["Make"] == "TestCameraMake"
+        assert metadata["exif"]["camera"] == {"make": "TestCameraMake"}
+
+        buffer = BytesIO()
+        Image.new("RGB", (32, 16)).save(buffer, format="PNG")
+        metadata = service.extract_image_metadata(base64.b64encode(buffer.getvalue()).decode())
+        assert metadata["exif"] == {}
+
+    def test_exif_parser_field_tables(self):
+        """Test camera and datetime fields are read from their piexif tag ids."""
+        camera = ExifParser.extract_camera_info({271: b"Canon", 305: b"fw 1.0", 999: b"x"})
+        assert camera == {"make": "Canon", "software": "fw 1.0"}
+
+        dates = ExifParser.extract_datetime_info({36868: b"2024:01:02 03:04:05"})
+        assert dates == {"digitized": "2024:01:02 03:04:05"}
+
+    def test_extract_image_metadata_invalid_payload(self):
+        """Test undecodable payloads are reported in the result instead of raising."""
+        assert "error" in MetadataService().extract_image_metadata("data:image/png;base64,ñññ")
+
+
+class TestReportService:
+    """Test suite for PDF report generation."""
+
+    def test_report_timestamp_formatted_once(self, monkeypatch):
+        """Test header, forensic table and footer share one generation timestamp."""
+        stamp = Mock(return_value="2026-01-02 03:04:05 UTC")
+        monkeypatch.setattr(generator, "report_timestamp", stamp)
+        monkeypatch.setattr(sections, "report_timestamp", Mock(side_effect=AssertionError))
+        metadata = {"forensics": {"sha256": "ab" * 32, "size_bytes": 10}}
+
+        pdf = ReportService().generate_analysis_report({"vision": {}}, metadata, "ev-1")
+
+        assert pdf.startswith(b"%PDF")
+        stamp.assert_called_once_with()
 
 
 if __name__ == "__main__":